@@ -5,8 +5,11 @@ Provides common functionality for database access, logging, and error handling.
 """
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Hashable, Tuple
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 
@@ -29,6 +32,89 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class AssignmentRow(NamedTuple):
+    """Scalar projection of an assignment used by the schedulers."""
+    id: str
+    task_id: Optional[str]
+    planned_hours: Optional[float]
+    planned_start: Optional[str]
+    planned_end: Optional[str]
+    allocation_percent: Optional[float]
+
+
+class SkillRequirements(NamedTuple):
+    """Skill requirements as parallel skill_id and minimum level columns."""
+    skill_ids: Tuple[Optional[str], ...]
+    min_levels: Tuple[Any, ...]
+
+
+# Only the scalar fields the schedulers read are projected, so rows come
+# back as plain tuples instead of hydrated ObjectModel instances.
+ASSIGNMENT_COLUMNS = (
+    ObjectModel.id,
+    ObjectModel.data['task_id'].as_string().label('task_id'),
+    ObjectModel.data['planned_hours'].as_float().label('planned_hours'),
+    ObjectModel.data['planned_start'].as_string().label('planned_start'),
+    ObjectModel.data['planned_end'].as_string().label('planned_end'),
+    ObjectModel.data['allocation_percent'].as_float().label('allocation_percent'),
+)
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a fixed TTL.
+    
+    Used for process-wide lookups that are read far more often than they
+    change. Callers own invalidation for mutations made in-process; the TTL
+    bounds staleness for changes made elsewhere.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted
+            ttl: Seconds an entry stays valid after being set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
 class SchedulerBase(ABC):
     """
     Base class for all PM schedulers.
@@ -99,6 +185,28 @@ class SchedulerBase(ABC):
         """Get a single object by ID."""
         return session.get(ObjectModel, object_id)
     
+    def get_objects_by_ids(
+        self,
+        session: Session,
+        object_ids: Iterable[str]
+    ) -> Dict[str, ObjectModel]:
+        """
+        Get several objects by ID in one query.
+        
+        Args:
+            session: Database session
+            object_ids: Object IDs to load (duplicates and None are ignored)
+            
+        Returns:
+            Dictionary of object ID to ObjectModel for the IDs that exist
+        """
+        ids = {object_id for object_id in object_ids if object_id}
+        if not ids:
+            return {}
+        
+        stmt = select(ObjectModel).where(ObjectModel.id.in_(ids))
+        return {obj.id: obj for obj in session.scalars(stmt).all()}
+    
     def update_object_data(
         self, 
         session: Session, 
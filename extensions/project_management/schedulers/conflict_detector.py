@@ -23,19 +23,73 @@ Usage:
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple, NamedTuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from collections import defaultdict
 
-from sqlalchemy import select, and_, or_
+import numpy as np
+from sqlalchemy import select, and_, or_, bindparam
+from sqlalchemy.orm import aliased
 
-from .base import SchedulerBase, ObjectModel, Session
+from .base import (
+    SchedulerBase, TTLCache, AssignmentRow, ASSIGNMENT_COLUMNS, ObjectModel, Session
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Hot statements are built once at import time so SQLAlchemy's compiled
+# cache can reuse them; per-call values are supplied via bind parameters.
+_ACTIVE_ASSIGNMENTS_STMT = select(ObjectModel).where(
+    and_(
+        ObjectModel.type_id == 'ot_assignment',
+        ObjectModel.status == 'active'
+    )
+)
+
+_PERSON_ASSIGNMENTS_STMT = select(*ASSIGNMENT_COLUMNS).where(
+    and_(
+        ObjectModel.type_id == 'ot_assignment',
+        ObjectModel.data['person_id'].as_string() == bindparam('person_id'),
+        ObjectModel.status == 'active'
+    )
+)
+
+_PEOPLE_ASSIGNMENTS_STMT = select(
+    ObjectModel.data['person_id'].as_string().label('person_id'),
+    *ASSIGNMENT_COLUMNS,
+).where(
+    and_(
+        ObjectModel.type_id == 'ot_assignment',
+        ObjectModel.data['person_id'].as_string().in_(
+            bindparam('person_ids', expanding=True)
+        ),
+        ObjectModel.status == 'active'
+    )
+)
+
+_sprint_task = aliased(ObjectModel)
+
+# Participant lists per sprint, shared by every detector in the process.
+# TTL-only: there is no in-process writer of participant links to invalidate it.
+_sprint_participants_cache = TTLCache(maxsize=1024, ttl=30)
+
+_SPRINT_TASKS_STMT = select(
+    _sprint_task.id,
+    _sprint_task.data['estimated_hours'].as_float().label('estimated_hours'),
+).select_from(ObjectModel).join(
+    _sprint_task, _sprint_task.id == ObjectModel.data['task_id'].as_string()
+).where(
+    and_(
+        ObjectModel.type_id == 'ot_sprint_task',
+        ObjectModel.data['sprint_id'].as_string() == bindparam('sprint_id'),
+        ObjectModel.status != 'deleted'
+    )
+)
+
+
 class ConflictType(str, Enum):
     """Types of conflicts."""
     OVERALLOCATION = "overallocation"
@@ -54,6 +108,12 @@ class ConflictSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+class SprintTaskRow(NamedTuple):
+    """Scalar projection of a task committed to a sprint."""
+    id: str
+    estimated_hours: Optional[float]
+
+
 @dataclass
 class Conflict:
     """Represents a detected conflict."""
@@ -289,54 +349,58 @@ class ConflictDetector(SchedulerBase):
             
             for person in people:
                 assignments = self._get_person_assignments(session, person.id)
+                soa = self._assignments_to_soa(assignments)
                 
-                # Check each pair of assignments for overlap
-                for i, assign1 in enumerate(assignments):
-                    for assign2 in assignments[i+1:]:
-                        overlap = self._get_assignment_overlap(assign1, assign2)
+                # Day-level overlap mask over all pairs; exact periods are
+                # only computed for the pairs that survive it
+                overlapping = (
+                    (soa['start'][:, None] <= soa['end'][None, :]) &
+                    (soa['start'][None, :] <= soa['end'][:, None])
+                )
+                
+                for i, j in zip(*np.nonzero(np.triu(overlapping, k=1)), strict=True):
+                    assign1 = assignments[soa['index'][i]]
+                    assign2 = assignments[soa['index'][j]]
+                    overlap = self._get_assignment_overlap(assign1, assign2)
+                    
+                    if overlap:
+                        task1 = self.get_object_by_id(session, assign1.task_id)
+                        task2 = self.get_object_by_id(session, assign2.task_id)
+                        
+                        total_allocation = (
+                            (assign1.allocation_percent or 0) +
+                            (assign2.allocation_percent or 0)
+                        )
                         
-                        if overlap:
-                            task1 = self.get_object_by_id(
-                                session, assign1.data.get('task_id')
-                            )
-                            task2 = self.get_object_by_id(
-                                session, assign2.data.get('task_id')
-                            )
-                            
-                            total_allocation = (
-                                assign1.data.get('allocation_percent', 0) +
-                                assign2.data.get('allocation_percent', 0)
-                            )
-                            
-                            if total_allocation > 100:
-                                conflicts.append(Conflict(
-                                    conflict_type=ConflictType.DOUBLE_BOOKING,
-                                    severity=ConflictSeverity.HIGH,
-                                    person_id=person.id,
-                                    person_name=person.data.get('name'),
-                                    task_id=assign1.data.get('task_id'),
-                                    task_title=task1.data.get('title') if task1 else 'Unknown',
-                                    sprint_id=None,
-                                    sprint_name=None,
-                                    description=(
-                                        f"{person.data.get('name')} has overlapping assignments: "
-                                        f"'{task1.data.get('title') if task1 else 'Unknown'}' and "
-                                        f"'{task2.data.get('title') if task2 else 'Unknown'}' "
-                                        f"({overlap['start']} to {overlap['end']})"
-                                    ),
-                                    date_range=overlap,
-                                    allocation_percentage=total_allocation,
-                                    suggested_actions=[
-                                        {
-                                            'type': 'stagger',
-                                            'description': 'Stagger task start dates'
-                                        },
-                                        {
-                                            'type': 'reassign_one',
-                                            'description': 'Reassign one task to another person'
-                                        }
-                                    ]
-                                ))
+                        if total_allocation > 100:
+                            conflicts.append(Conflict(
+                                conflict_type=ConflictType.DOUBLE_BOOKING,
+                                severity=ConflictSeverity.HIGH,
+                                person_id=person.id,
+                                person_name=person.data.get('name'),
+                                task_id=assign1.task_id,
+                                task_title=task1.data.get('title') if task1 else 'Unknown',
+                                sprint_id=None,
+                                sprint_name=None,
+                                description=(
+                                    f"{person.data.get('name')} has overlapping assignments: "
+                                    f"'{task1.data.get('title') if task1 else 'Unknown'}' and "
+                                    f"'{task2.data.get('title') if task2 else 'Unknown'}' "
+                                    f"({overlap['start']} to {overlap['end']})"
+                                ),
+                                date_range=overlap,
+                                allocation_percentage=total_allocation,
+                                suggested_actions=[
+                                    {
+                                        'type': 'stagger',
+                                        'description': 'Stagger task start dates'
+                                    },
+                                    {
+                                        'type': 'reassign_one',
+                                        'description': 'Reassign one task to another person'
+                                    }
+                                ]
+                            ))
         
         self.logger.info(f"Detected {len(conflicts)} double bookings")
         return conflicts
@@ -352,13 +416,7 @@ class ConflictDetector(SchedulerBase):
         
         with self.get_session() as session:
             # Get all active assignments
-            stmt = select(ObjectModel).where(
-                and_(
-                    ObjectModel.type_id == 'ot_assignment',
-                    ObjectModel.status == 'active'
-                )
-            )
-            assignments = session.scalars(stmt).all()
+            assignments = session.scalars(_ACTIVE_ASSIGNMENTS_STMT).all()
             
             for assignment in assignments:
                 task_id = assignment.data.get('task_id')
@@ -499,9 +557,7 @@ class ConflictDetector(SchedulerBase):
                 
                 # Calculate committed hours
                 sprint_tasks = self._get_sprint_tasks(session, sprint_id)
-                committed_hours = sum(
-                    t.data.get('estimated_hours', 0) for t in sprint_tasks
-                )
+                committed_hours = sum(t.estimated_hours or 0 for t in sprint_tasks)
                 
                 # Calculate capacity
                 participants = self._get_sprint_participants(session, sprint_id)
@@ -737,15 +793,28 @@ class ConflictDetector(SchedulerBase):
             sprint_tasks = self._get_sprint_tasks(session, sprint_id)
             
             total_capacity = sum(p.get('planned_capacity_hours', 80) for p in participants)
-            committed_hours = sum(t.data.get('estimated_hours', 0) for t in sprint_tasks)
+            committed_hours = sum(t.estimated_hours or 0 for t in sprint_tasks)
+            
+            task_ids = {t.id for t in sprint_tasks}
+            assignments_by_person = self._get_assignments_by_person(
+                session, [p['id'] for p in participants]
+            )
             
             # Check each person's load
             person_loads = []
+            overloaded_names = []
+            total_allocated = 0
             for participant in participants:
                 person_hours = self._calculate_person_sprint_hours(
-                    session, participant['id'], sprint_tasks
+                    session,
+                    participant['id'],
+                    task_ids,
+                    assignments_by_person.get(participant['id'], [])
                 )
                 utilization = (person_hours / participant.get('planned_capacity_hours', 80)) * 100
+                total_allocated += person_hours
+                if utilization > 100:
+                    overloaded_names.append(participant['name'])
                 
                 person_loads.append({
                     'person_id': participant['id'],
@@ -756,7 +825,7 @@ class ConflictDetector(SchedulerBase):
                     'status': 'overallocated' if utilization > 100 else 'ok'
                 })
             
-            overallocation_count = sum(1 for p in person_loads if p['status'] == 'overallocated')
+            overallocation_count = len(overloaded_names)
             
             commitment_ratio = (committed_hours / total_capacity * 100) if total_capacity > 0 else 0
             
@@ -770,7 +839,7 @@ class ConflictDetector(SchedulerBase):
                 'participant_loads': person_loads,
                 'overallocation_count': overallocation_count,
                 'recommendations': self._generate_capacity_recommendations(
-                    commitment_ratio, overallocation_count, person_loads
+                    commitment_ratio, overallocation_count, overloaded_names, total_allocated
                 )
             }
     
@@ -778,84 +847,154 @@ class ConflictDetector(SchedulerBase):
         self,
         session: Session,
         person_id: str
-    ) -> List[ObjectModel]:
+    ) -> List[AssignmentRow]:
         """Get all active assignments for a person."""
-        stmt = select(ObjectModel).where(
-            and_(
-                ObjectModel.type_id == 'ot_assignment',
-                ObjectModel.data['person_id'].astext == person_id,
-                ObjectModel.status == 'active'
-            )
-        )
-        return list(session.scalars(stmt).all())
+        rows = session.execute(_PERSON_ASSIGNMENTS_STMT, {'person_id': person_id})
+        return [AssignmentRow._make(row) for row in rows]
     
-    def _calculate_daily_allocations(
+    def _get_assignments_by_person(
         self,
         session: Session,
-        assignments: List[ObjectModel],
+        person_ids: List[str]
+    ) -> Dict[str, List[AssignmentRow]]:
+        """Get active assignments for several people in one query."""
+        if not person_ids:
+            return {}
+        
+        assignments = defaultdict(list)
+        rows = session.execute(_PEOPLE_ASSIGNMENTS_STMT, {'person_ids': list(person_ids)})
+        for person_id, *fields in rows:
+            assignments[person_id].append(AssignmentRow._make(fields))
+        
+        return dict(assignments)
+    
+    def _assignments_to_soa(
+        self,
+        assignments: List[AssignmentRow],
         date_range: Optional[Dict[str, str]] = None
-    ) -> Dict[str, float]:
-        """Calculate daily allocation percentages."""
-        daily_allocations = defaultdict(float)
+    ) -> Dict[str, np.ndarray]:
+        """
+        Convert assignment rows to struct-of-arrays form.
         
-        for assignment in assignments:
-            start = assignment.data.get('planned_start')
-            end = assignment.data.get('planned_end')
-            allocation = assignment.data.get('allocation_percent', 100)
+        Returns contiguous arrays keyed by field:
+        - 'index': position of each entry in ``assignments``
+        - 'start' / 'end': calendar days of planned start and end
+        - 'days': number of days covered, stepping a day at a time from
+          the planned start without passing the planned end
+        - 'alloc': allocation in hundredths of a percent (100% when unset)
+        
+        Assignments missing either date are left out, as are ISO string
+        dates whose calendar day falls outside ``date_range``; those are
+        rejected by comparing the ``YYYY-MM-DD`` prefix before parsing.
+        """
+        index, starts, ends, days, allocs = [], [], [], [], []
+        
+        if date_range:
+            range_start = date_range['start'][:10]
+            range_end = date_range['end'][:10]
+        
+        for i, assignment in enumerate(assignments):
+            start = assignment.planned_start
+            end = assignment.planned_end
             
             if not start or not end:
                 continue
             
+            if (
+                date_range and isinstance(start, str) and isinstance(end, str)
+                and (end[:10] < range_start or start[:10] > range_end)
+            ):
+                continue
+            
             if isinstance(start, str):
                 start = datetime.fromisoformat(start.replace('Z', '+00:00'))
             if isinstance(end, str):
                 end = datetime.fromisoformat(end.replace('Z', '+00:00'))
             
-            # Filter by date range if specified
-            if date_range:
-                range_start = datetime.fromisoformat(date_range['start'])
-                range_end = datetime.fromisoformat(date_range['end'])
-                
-                if end < range_start or start > range_end:
-                    continue
+            allocation = assignment.allocation_percent
             
-            # Add allocation for each day
-            current = start
-            while current <= end:
-                date_str = current.strftime('%Y-%m-%d')
-                daily_allocations[date_str] += allocation
-                current += timedelta(days=1)
-        
-        return dict(daily_allocations)
+            index.append(i)
+            starts.append(start.date())
+            ends.append(end.date())
+            days.append(max(0, (end - start) // timedelta(days=1) + 1))
+            allocs.append(10000 if allocation is None else int(round(allocation * 100)))
+        
+        return {
+            'index': np.array(index, dtype=np.int64),
+            'start': np.array(starts, dtype='datetime64[D]'),
+            'end': np.array(ends, dtype='datetime64[D]'),
+            'days': np.array(days, dtype=np.int64),
+            'alloc': np.array(allocs, dtype=np.int32),
+        }
+    
+    def _calculate_daily_allocations(
+        self,
+        session: Session,
+        assignments: List[AssignmentRow],
+        date_range: Optional[Dict[str, str]] = None
+    ) -> Dict[str, float]:
+        """Calculate daily allocation percentages."""
+        soa = self._assignments_to_soa(assignments, date_range)
+        mask = soa['days'] > 0
+        
+        # Filter by date range if specified
+        if date_range:
+            range_start = np.datetime64(datetime.fromisoformat(date_range['start']).date())
+            range_end = np.datetime64(datetime.fromisoformat(date_range['end']).date())
+            mask &= (soa['end'] >= range_start) & (soa['start'] <= range_end)
+        
+        if not mask.any():
+            return {}
+        
+        starts = soa['start'][mask]
+        allocs = soa['alloc'][mask]
+        
+        # Difference arrays over the covered span: +alloc on the first day,
+        # -alloc on the day after the last, then a prefix sum per day
+        origin = starts.min()
+        first = (starts - origin).astype(np.int64)
+        stop = first + soa['days'][mask]
+        
+        totals = np.zeros(int(stop.max()) + 1, dtype=np.int32)
+        coverage = np.zeros(int(stop.max()) + 1, dtype=np.int64)
+        np.add.at(totals, first, allocs)
+        np.add.at(totals, stop, -allocs)
+        np.add.at(coverage, first, 1)
+        np.add.at(coverage, stop, -1)
+        
+        totals = np.cumsum(totals[:-1])
+        covered = np.nonzero(np.cumsum(coverage[:-1]) > 0)[0]
+        dates = np.datetime_as_string(origin + covered, unit='D')
+        
+        return dict(zip(dates.tolist(), (totals[covered] / 100).tolist(), strict=True))
     
     def _get_assignment_overlap(
         self,
-        assign1: ObjectModel,
-        assign2: ObjectModel
+        assign1: AssignmentRow,
+        assign2: AssignmentRow
     ) -> Optional[Dict[str, str]]:
-        """Get overlap period between two assignments."""
-        start1 = assign1.data.get('planned_start')
-        end1 = assign1.data.get('planned_end')
-        start2 = assign2.data.get('planned_start')
-        end2 = assign2.data.get('planned_end')
+        """Get overlap period (whole days) between two assignments."""
+        dates = (
+            assign1.planned_start, assign1.planned_end,
+            assign2.planned_start, assign2.planned_end
+        )
         
-        if not all([start1, end1, start2, end2]):
+        if not all(dates):
             return None
         
-        if isinstance(start1, str):
-            start1 = datetime.fromisoformat(start1.replace('Z', '+00:00'))
-        if isinstance(end1, str):
-            end1 = datetime.fromisoformat(end1.replace('Z', '+00:00'))
-        if isinstance(start2, str):
-            start2 = datetime.fromisoformat(start2.replace('Z', '+00:00'))
-        if isinstance(end2, str):
-            end2 = datetime.fromisoformat(end2.replace('Z', '+00:00'))
+        # Compare proleptic day ordinals as plain ints
+        days = []
+        for value in dates:
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            days.append(value.toordinal())
+        start1, end1, start2, end2 = days
         
         # Check overlap
         if start1 <= end2 and start2 <= end1:
             return {
-                'start': max(start1, start2).isoformat(),
-                'end': min(end1, end2).isoformat()
+                'start': datetime.fromordinal(max(start1, start2)).isoformat(),
+                'end': datetime.fromordinal(min(end1, end2)).isoformat()
             }
         
         return None
@@ -865,7 +1004,17 @@ class ConflictDetector(SchedulerBase):
         session: Session,
         sprint_id: str
     ) -> List[Dict[str, Any]]:
-        """Get sprint participants."""
+        """
+        Get sprint participants (cached per sprint; callers get copies).
+        
+        Nothing in this process writes lt_sprint_has_participant links, so
+        the 30s TTL is the only freshness guarantee: participant changes
+        show up once the cached entry expires.
+        """
+        cached = _sprint_participants_cache.get(sprint_id)
+        if cached is not None:
+            return [dict(p) for p in cached]
+        
         links = self.get_linked_objects(
             session, sprint_id, link_type_id='lt_sprint_has_participant'
         )
@@ -880,50 +1029,33 @@ class ConflictDetector(SchedulerBase):
                 'planned_capacity_hours': link['link_data'].get('planned_capacity_hours', 80)
             })
         
-        return participants
+        _sprint_participants_cache.set(sprint_id, participants)
+        return [dict(p) for p in participants]
     
     def _get_sprint_tasks(
         self,
         session: Session,
         sprint_id: str
-    ) -> List[ObjectModel]:
+    ) -> List[SprintTaskRow]:
         """Get tasks in a sprint."""
-        stmt = select(ObjectModel).where(
-            and_(
-                ObjectModel.type_id == 'ot_sprint_task',
-                ObjectModel.data['sprint_id'].astext == sprint_id,
-                ObjectModel.status != 'deleted'
-            )
-        )
-        sprint_task_links = session.scalars(stmt).all()
-        
-        tasks = []
-        for link in sprint_task_links:
-            task_id = link.data.get('task_id')
-            if task_id:
-                task = self.get_object_by_id(session, task_id)
-                if task:
-                    tasks.append(task)
-        
-        return tasks
+        rows = session.execute(_SPRINT_TASKS_STMT, {'sprint_id': sprint_id})
+        return [SprintTaskRow._make(row) for row in rows]
     
     def _calculate_person_sprint_hours(
         self,
         session: Session,
         person_id: str,
-        sprint_tasks: List[ObjectModel]
+        task_ids: Set[str],
+        assignments: Optional[List[AssignmentRow]] = None
     ) -> float:
         """Calculate hours assigned to a person from sprint tasks."""
-        task_ids = {t.id for t in sprint_tasks}
-        
-        # Get assignments for this person
-        assignments = self._get_person_assignments(session, person_id)
+        if assignments is None:
+            assignments = self._get_person_assignments(session, person_id)
         
         total_hours = 0
         for assignment in assignments:
-            task_id = assignment.data.get('task_id')
-            if task_id in task_ids:
-                total_hours += assignment.data.get('planned_hours', 0)
+            if assignment.task_id in task_ids:
+                total_hours += assignment.planned_hours or 0
         
         return total_hours
     
@@ -931,15 +1063,17 @@ class ConflictDetector(SchedulerBase):
         self,
         commitment_ratio: float,
         overallocation_count: int,
-        person_loads: List[Dict]
+        overloaded_names: List[str],
+        total_allocated: float
     ) -> List[str]:
         """Generate recommendations based on capacity analysis."""
         recommendations = []
         
         if commitment_ratio > 100:
+            excess = commitment_ratio - 100
             recommendations.append(
-                f"Sprint is overcommitted by {commitment_ratio - 100:.0f}%. "
-                f"Remove {int((commitment_ratio - 100) / 100 * sum(p['allocated_hours'] for p in person_loads) / 8)} tasks."
+                f"Sprint is overcommitted by {excess:.0f}%. "
+                f"Remove {int(excess / 100 * total_allocated / 8)} tasks."
             )
         elif commitment_ratio > 85:
             recommendations.append(
@@ -953,10 +1087,9 @@ class ConflictDetector(SchedulerBase):
             )
         
         if overallocation_count > 0:
-            overloaded = [p for p in person_loads if p['status'] == 'overallocated']
             recommendations.append(
                 f"{overallocation_count} team members are overallocated: "
-                f"{', '.join(p['person_name'] for p in overloaded)}. "
+                f"{', '.join(overloaded_names)}. "
                 f"Rebalance workload immediately."
             )
         
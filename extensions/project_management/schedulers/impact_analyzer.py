@@ -25,19 +25,132 @@ Usage:
     )
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Any, Set
-from datetime import datetime, timedelta
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Any, Set
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 
-from sqlalchemy import select, and_, or_
+import numpy as np
+from sqlalchemy import select, and_, or_, func, bindparam
+from sqlalchemy.orm import aliased
 
-from .base import SchedulerBase, ObjectModel, LinkModel, Session
+from .base import (
+    SchedulerBase, TTLCache, AssignmentRow, ASSIGNMENT_COLUMNS, SkillRequirements,
+    ObjectModel, LinkModel, Session
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Hot statements are built once at import time so SQLAlchemy's compiled
+# cache can reuse them; per-call values are supplied via bind parameters.
+_PERSON_ASSIGNMENTS_STMT = select(*ASSIGNMENT_COLUMNS).join(
+    LinkModel, LinkModel.source_id == ObjectModel.id
+).where(
+    and_(
+        LinkModel.type_id == 'lt_assignment_to_person',
+        LinkModel.target_id == bindparam('person_id'),
+        ObjectModel.status != 'deleted'
+    )
+).execution_options(yield_per=500)
+
+_PERSON_ASSIGNMENTS_IN_PERIOD_STMT = _PERSON_ASSIGNMENTS_STMT.where(
+    and_(
+        ObjectModel.data['planned_start'].as_string() < bindparam('latest_start'),
+        ObjectModel.data['planned_end'].as_string() >= bindparam('earliest_end')
+    )
+)
+
+_person_allocations = select(
+    LinkModel.target_id.label('person_id'),
+    func.sum(ObjectModel.data['allocation_percent'].as_float()).label('total_allocation')
+).join(
+    ObjectModel, ObjectModel.id == LinkModel.source_id
+).where(
+    and_(
+        LinkModel.type_id == 'lt_assignment_to_person',
+        ObjectModel.status != 'deleted'
+    )
+).group_by(LinkModel.target_id).subquery()
+
+_available_people = select(ObjectModel).outerjoin(
+    _person_allocations, _person_allocations.c.person_id == ObjectModel.id
+).where(
+    and_(
+        ObjectModel.type_id == 'ot_person',
+        ObjectModel.status == 'active',
+        # Has capacity if < 80% allocated
+        func.coalesce(_person_allocations.c.total_allocation, 0) < 80
+    )
+)
+
+_AVAILABLE_PEOPLE_STMT = _available_people.limit(1000)
+
+_AVAILABLE_PEOPLE_EXCLUDING_STMT = _available_people.where(
+    ObjectModel.id != bindparam('exclude_person_id')
+).limit(1000)
+
+_skill = aliased(ObjectModel)
+
+_QUALIFIED_PEOPLE_STMT = _available_people.where(
+    ObjectModel.id.in_(
+        select(LinkModel.source_id).join(
+            _skill, _skill.id == LinkModel.target_id
+        ).where(
+            and_(
+                LinkModel.type_id == 'lt_person_has_skill',
+                _skill.data['skill_id'].as_string().in_(
+                    bindparam('skill_ids', expanding=True)
+                ),
+                _skill.status != 'deleted'
+            )
+        )
+    )
+).limit(1000)
+
+# skill_id -> proficiency maps per person, shared by every analyzer in the process.
+# TTL-only: there is no in-process writer of skill links to invalidate it.
+_person_skills_cache = TTLCache(maxsize=4096, ttl=30)
+
+_PERSON_SKILLS_STMT = select(
+    LinkModel.source_id,
+    LinkModel.data,
+    ObjectModel.data['skill_id'].as_string()
+).join(
+    ObjectModel, LinkModel.target_id == ObjectModel.id
+).where(
+    and_(
+        LinkModel.type_id == 'lt_person_has_skill',
+        LinkModel.source_id.in_(bindparam('person_ids', expanding=True)),
+        ObjectModel.status != 'deleted'
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 string, accepting a trailing 'Z'.
+    
+    Assignments often share the same start/end strings, so parsed values
+    are cached; datetimes are immutable and safe to share.
+    """
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(value: datetime) -> int:
+    """Convert a naive UTC datetime to whole seconds since the Unix epoch."""
+    return (value - _EPOCH) // timedelta(seconds=1)
+
+
 class ImpactLevel(str, Enum):
     """Impact severity levels."""
     LOW = "low"
@@ -88,6 +201,7 @@ class ImpactAnalyzer(SchedulerBase):
     def __init__(self, db_adapter=None, neo4j_adapter=None):
         super().__init__(db_adapter, neo4j_adapter)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._critical_path_cache: Dict[str, bool] = {}
     
     async def run(self, analysis_type: str, **params) -> ImpactReport:
         """
@@ -138,8 +252,8 @@ class ImpactAnalyzer(SchedulerBase):
                 raise ValueError(f"Person {person_id} not found")
             
             # Parse dates
-            leave_start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-            leave_end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            leave_start = _parse_iso_datetime(start_date)
+            leave_end = _parse_iso_datetime(end_date)
             leave_days = (leave_end - leave_start).days + 1
             
             # Find affected assignments (tasks assigned during leave period)
@@ -151,9 +265,16 @@ class ImpactAnalyzer(SchedulerBase):
             affected_tasks = []
             affected_project_ids = set()
             total_delay_days = 0
+            total_planned_hours = 0
+            
+            # Calculate delays for all affected assignments at once
+            task_delays = self._calculate_task_delays(affected_assignments, leave_days)
+            tasks = self.get_objects_by_ids(
+                session, (a.task_id for a in affected_assignments)
+            )
             
-            for assignment in affected_assignments:
-                task = self.get_object_by_id(session, assignment.data.get('task_id'))
+            for assignment, task_delay in zip(affected_assignments, task_delays, strict=True):
+                task = tasks.get(assignment.task_id)
                 if not task:
                     continue
                     
@@ -161,34 +282,47 @@ class ImpactAnalyzer(SchedulerBase):
                 if project_id:
                     affected_project_ids.add(project_id)
                 
-                # Calculate delay for this task
-                task_delay = self._calculate_task_delay(
-                    task, assignment, leave_days
-                )
+                task_delay = int(task_delay)
                 total_delay_days += task_delay
+                planned_hours = assignment.planned_hours or 0
+                total_planned_hours += planned_hours
                 
                 affected_tasks.append({
                     'task_id': task.id,
                     'task_title': task.data.get('title', 'Unknown'),
                     'project_id': project_id,
                     'assignment_id': assignment.id,
-                    'planned_hours': assignment.data.get('planned_hours', 0),
+                    'planned_hours': planned_hours,
                     'delay_days': task_delay,
-                    'on_critical_path': self._is_on_critical_path(task.id)
+                    'on_critical_path': False
                 })
             
+            # One graph round trip covers every affected task. It is skipped
+            # when the counts alone already make the impact critical, and
+            # on_critical_path is left unknown (None).
+            if self._is_critical_without_path(len(affected_tasks), total_delay_days):
+                for task_info in affected_tasks:
+                    task_info['on_critical_path'] = None
+            else:
+                critical_path = self._bulk_critical_path(
+                    [t['task_id'] for t in affected_tasks]
+                )
+                for task_info in affected_tasks:
+                    task_info['on_critical_path'] = critical_path.get(task_info['task_id'], False)
+            
             # Get affected projects
+            project_task_counts = Counter(
+                t['project_id'] for t in affected_tasks if t['project_id']
+            )
+            projects = self.get_objects_by_ids(session, affected_project_ids)
             affected_projects = []
             for project_id in affected_project_ids:
-                project = self.get_object_by_id(session, project_id)
+                project = projects.get(project_id)
                 if project:
                     affected_projects.append({
                         'project_id': project_id,
                         'project_name': project.data.get('name', 'Unknown'),
-                        'affected_tasks_count': sum(
-                            1 for t in affected_tasks 
-                            if t['project_id'] == project_id
-                        )
+                        'affected_tasks_count': project_task_counts[project_id]
                     })
             
             # Determine impact level
@@ -198,12 +332,17 @@ class ImpactAnalyzer(SchedulerBase):
                 any(t['on_critical_path'] for t in affected_tasks)
             )
             
-            # Find alternative resources
+            # Find alternative resources. The candidate pool does not depend
+            # on the task, so it is loaded once and ranked per task.
             alternatives = []
+            candidates = self._get_available_people(session, exclude_person_id=person_id)
+            person_skills = self._bulk_load_person_skills(
+                session, [p.id for p in candidates]
+            )
             for task_info in affected_tasks[:5]:  # Top 5 most critical
-                task_alternatives = await self.find_alternative_resources(
-                    task_info['task_id'],
-                    exclude_person_id=person_id
+                task_alternatives = self._rank_alternatives(
+                    session, task_info['task_id'], candidates,
+                    person_skills=person_skills
                 )
                 if task_alternatives:
                     alternatives.append({
@@ -219,7 +358,7 @@ class ImpactAnalyzer(SchedulerBase):
             
             # Calculate cost impact
             cost_impact = self._calculate_leave_cost_impact(
-                session, affected_tasks, leave_days
+                total_planned_hours, leave_days
             )
             
             summary = (
@@ -288,8 +427,9 @@ class ImpactAnalyzer(SchedulerBase):
             # Calculate removed work
             total_removed_hours = 0
             removed_task_details = []
+            tasks = self.get_objects_by_ids(session, removed_tasks)
             for task_id in removed_tasks:
-                task = self.get_object_by_id(session, task_id)
+                task = tasks.get(task_id)
                 if task:
                     hours = task.data.get('estimated_hours', 0)
                     total_removed_hours += hours
@@ -303,12 +443,8 @@ class ImpactAnalyzer(SchedulerBase):
             net_hours = total_added_hours - total_removed_hours
             
             # Current project stats
-            current_tasks = self.get_linked_objects(
-                session, project_id, link_type_id='lt_project_has_task'
-            )
-            current_total_hours = sum(
-                t['object'].data.get('estimated_hours', 0)
-                for t in current_tasks
+            current_total_hours = self._sum_linked_field(
+                session, project_id, 'lt_project_has_task', 'estimated_hours'
             )
             
             # Estimate new end date (simplified)
@@ -318,14 +454,15 @@ class ImpactAnalyzer(SchedulerBase):
                 # Assuming 8 hours per day and 5 day work week
                 additional_days = (net_hours / 8) * (7/5)  # Account for weekends
                 if isinstance(current_end, str):
-                    current_end = datetime.fromisoformat(current_end.replace('Z', '+00:00'))
+                    current_end = _parse_iso_datetime(current_end)
                 new_end_date = (current_end + timedelta(days=additional_days)).isoformat()
             
             # Check for resource conflicts
             resource_conflicts = []
             if added_tasks:
                 resource_conflicts = self._check_resource_availability(
-                    session, project_id, added_tasks
+                    session, project_id, added_tasks,
+                    current_hours=current_total_hours
                 )
             
             # Determine impact level
@@ -410,25 +547,10 @@ class ImpactAnalyzer(SchedulerBase):
                 raise ValueError(f"Person {person_id} not found")
             
             # Get all assignments for this person
-            assignments = self._get_person_assignments(session, person_id)
+            assignments = list(self._get_person_assignments(session, person_id))
             
             # Find conflicts (simplified - overlapping assignments)
-            conflicts = []
-            for i, assign1 in enumerate(assignments):
-                for assign2 in assignments[i+1:]:
-                    if self._assignments_overlap(assign1, assign2):
-                        total_allocation = (
-                            assign1.data.get('allocation_percent', 0) +
-                            assign2.data.get('allocation_percent', 0)
-                        )
-                        if total_allocation > 100:
-                            conflicts.append({
-                                'assignment1': assign1.id,
-                                'assignment2': assign2.id,
-                                'date_range': self._get_overlap_period(assign1, assign2),
-                                'total_allocation': total_allocation,
-                                'excess': total_allocation - 100
-                            })
+            conflicts = self._find_overallocated_pairs(assignments)
             
             impact_level = ImpactLevel.LOW
             if len(conflicts) > 5:
@@ -480,45 +602,119 @@ class ImpactAnalyzer(SchedulerBase):
             List of alternative people with match scores
         """
         with self.get_session() as session:
-            task = self.get_object_by_id(session, task_id)
-            if not task:
-                return []
-            
             # Get required skills for the task
             skill_requirements = self.get_linked_objects(
                 session, task_id, link_type_id='lt_task_requires_skill'
             )
+            required_skill_ids = [
+                r['object'].data.get('skill_id') for r in skill_requirements
+                if r['object'].data.get('skill_id')
+            ]
             
-            # Get all active people
-            people = self.get_objects_by_type(session, 'ot_person', status='active')
-            
-            alternatives = []
-            for person in people:
-                if person.id == exclude_person_id:
-                    continue
-                
-                # Check availability (simplified)
-                has_capacity = self._check_person_capacity(session, person.id)
-                if not has_capacity:
-                    continue
-                
-                # Calculate skill match
-                skill_match = self._calculate_skill_match(
-                    session, person.id, skill_requirements
+            # Only people holding a required skill can score above zero
+            if required_skill_ids:
+                candidates = self._get_qualified_people(
+                    session, required_skill_ids, exclude_person_id=exclude_person_id
+                )
+            else:
+                candidates = self._get_available_people(
+                    session, exclude_person_id=exclude_person_id
                 )
-                
-                alternatives.append({
-                    'person_id': person.id,
-                    'person_name': person.data.get('name'),
-                    'skill_match_score': skill_match['score'],
-                    'matching_skills': skill_match['matches'],
-                    'missing_skills': skill_match['missing']
-                })
             
-            # Sort by skill match score
-            alternatives.sort(key=lambda x: x['skill_match_score'], reverse=True)
+            return self._rank_alternatives(
+                session, task_id, candidates, limit,
+                skill_requirements=skill_requirements
+            )
+    
+    def _get_available_people(
+        self,
+        session: Session,
+        exclude_person_id: Optional[str] = None
+    ) -> List[ObjectModel]:
+        """
+        Get active people with spare capacity, minus the excluded person.
+        
+        Allocation is summed per person in SQL, so capacity is checked in
+        the same query that loads the people.
+        """
+        if exclude_person_id:
+            return list(session.scalars(
+                _AVAILABLE_PEOPLE_EXCLUDING_STMT,
+                {'exclude_person_id': exclude_person_id}
+            ).all())
+        
+        return list(session.scalars(_AVAILABLE_PEOPLE_STMT).all())
+    
+    def _get_qualified_people(
+        self,
+        session: Session,
+        skill_ids: List[str],
+        exclude_person_id: Optional[str] = None
+    ) -> List[ObjectModel]:
+        """Get available people who hold at least one of the given skills."""
+        people = session.scalars(
+            _QUALIFIED_PEOPLE_STMT, {'skill_ids': list(skill_ids)}
+        ).all()
+        return [person for person in people if person.id != exclude_person_id]
+    
+    def _rank_alternatives(
+        self,
+        session: Session,
+        task_id: str,
+        candidates: List[ObjectModel],
+        limit: int = 5,
+        person_skills: Optional[Dict[str, Dict[str, int]]] = None,
+        skill_requirements: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidate people by how well they match a task's skills.
+        
+        Candidate skills are loaded in one query unless the caller passes
+        person_skills preloaded with _bulk_load_person_skills.
+        """
+        task = self.get_object_by_id(session, task_id)
+        if not task:
+            return []
+        
+        # Get required skills for the task unless they were preloaded
+        if skill_requirements is None:
+            skill_requirements = self.get_linked_objects(
+                session, task_id, link_type_id='lt_task_requires_skill'
+            )
+        
+        if person_skills is None:
+            person_skills = self._bulk_load_person_skills(
+                session, [p.id for p in candidates]
+            )
+        
+        requirements = self._materialize_requirements(skill_requirements)
+        scores = self._calculate_skill_match_batch(
+            session, [p.id for p in candidates], skill_requirements,
+            person_skills=person_skills, requirements=requirements
+        )
+        
+        # Sort by skill match score; the stable sort keeps candidate order
+        # among ties, and details are only built for the people returned
+        top = np.argsort(-np.round(scores, 2), kind='stable')[:limit]
+        
+        alternatives = []
+        for index in top:
+            person = candidates[index]
+            skill_match = self._calculate_skill_match(
+                session, person.id, skill_requirements,
+                person_skill_map=person_skills.get(person.id, {}),
+                requirements=requirements
+            )
             
-            return alternatives[:limit]
+            alternatives.append({
+                'person_id': person.id,
+                'person_name': person.data.get('name'),
+                'skill_match_score': skill_match['score'],
+                'matching_skills': skill_match['matches'],
+                'missing_skills': skill_match['missing']
+            })
+        
+        return alternatives
     
     # Helper methods
     
@@ -528,76 +724,99 @@ class ImpactAnalyzer(SchedulerBase):
         person_id: str,
         start_date: datetime,
         end_date: datetime
-    ) -> List[ObjectModel]:
+    ) -> List[AssignmentRow]:
         """Get assignments that overlap with a date period."""
-        # Find assignments linked to this person
-        stmt = select(LinkModel).where(
-            and_(
-                LinkModel.type_id == 'lt_assignment_to_person',
-                LinkModel.target_id == person_id
-            )
-        )
-        assignment_links = session.scalars(stmt).all()
-        
-        assignments = []
-        for link in assignment_links:
-            assignment = self.get_object_by_id(session, link.source_id)
-            if assignment and assignment.status != 'deleted':
-                # Check date overlap
-                assign_start = assignment.data.get('planned_start')
-                assign_end = assignment.data.get('planned_end')
-                
-                if assign_start and assign_end:
-                    if isinstance(assign_start, str):
-                        assign_start = datetime.fromisoformat(assign_start.replace('Z', '+00:00'))
-                    if isinstance(assign_end, str):
-                        assign_end = datetime.fromisoformat(assign_end.replace('Z', '+00:00'))
-                    
-                    # Check overlap
-                    if assign_start <= end_date and assign_end >= start_date:
-                        assignments.append(assignment)
+        rows = []
+        starts = []
+        ends = []
+        for assignment in self._get_person_assignments(
+            session, person_id, start_date, end_date
+        ):
+            assign_start = assignment.planned_start
+            assign_end = assignment.planned_end
+            if assign_start and assign_end:
+                rows.append(assignment)
+                starts.append(self._as_utc_naive(assign_start))
+                ends.append(self._as_utc_naive(assign_end))
+        
+        if not rows:
+            return []
         
-        return assignments
+        # Exact overlap check on the rows the SQL day filter kept
+        mask = (
+            (np.array(starts, dtype='datetime64[us]') <= np.datetime64(self._as_utc_naive(end_date))) &
+            (np.array(ends, dtype='datetime64[us]') >= np.datetime64(self._as_utc_naive(start_date)))
+        )
+        return [rows[i] for i in np.nonzero(mask)[0]]
+    
+    def _as_utc_naive(self, value: Any) -> datetime:
+        """Parse an ISO string or datetime into a naive UTC datetime."""
+        if isinstance(value, str):
+            value = _parse_iso_datetime(value)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
     
-    def _calculate_task_delay(
+    def _calculate_task_delays(
         self,
-        task: ObjectModel,
-        assignment: ObjectModel,
+        assignments: List[AssignmentRow],
         leave_days: int
-    ) -> int:
-        """Calculate delay in days for a task due to leave."""
+    ) -> np.ndarray:
+        """Calculate delay in days for each assignment's task due to leave."""
         # Simple calculation: if assignment is fully during leave, delay by leave days
         # In production, this would consider:
         # - Partial overlaps
         # - Task dependencies
         # - Critical path analysis
-        planned_hours = assignment.data.get('planned_hours', 0)
+        planned_hours = np.array(
+            [a.planned_hours or 0 for a in assignments],
+            dtype=np.float64
+        )
         daily_hours = 8  # Assume 8 hours per day
         
-        assignment_days = planned_hours / daily_hours
-        return min(int(assignment_days), leave_days)
+        assignment_days = (planned_hours / daily_hours).astype(np.int32)
+        return np.minimum(assignment_days, leave_days)
     
     def _is_on_critical_path(self, task_id: str) -> bool:
         """Check if task is on the critical path using Neo4j."""
-        if not self.neo4j:
-            return False
-            
-        try:
-            # Query for tasks that depend on this task
-            query = """
-            MATCH (t:Object {id: $task_id})-[:lt_task_blocks]->(dependent:Object)
-            RETURN count(dependent) as dependent_count
-            """
-            result = self.neo4j.execute_read(query, {'task_id': task_id})
-            
-            # If many tasks depend on this, it's likely on critical path
-            if result and result[0].get('dependent_count', 0) > 2:
-                return True
+        return self._bulk_critical_path([task_id]).get(task_id, False)
+    
+    def _bulk_critical_path(self, task_ids: List[str]) -> Dict[str, bool]:
+        """
+        Check which tasks are on the critical path with a single Neo4j query.
+        
+        Results are memoized on the analyzer, so repeated analyses within one
+        run only query tasks they have not seen yet.
+        """
+        pending = [tid for tid in dict.fromkeys(task_ids) if tid not in self._critical_path_cache]
+        if pending and self.neo4j:
+            try:
+                # Count tasks that depend on each task
+                query = """
+                UNWIND $task_ids AS tid
+                OPTIONAL MATCH (t:Object {id: tid})-[:lt_task_blocks]->(dependent:Object)
+                RETURN tid, count(dependent) as dependent_count
+                """
+                result = self.neo4j.execute_read(query, {'task_ids': pending})
                 
-        except Exception as e:
-            self.logger.warning(f"Neo4j query failed for critical path: {e}")
-            
-        return False
+                # If many tasks depend on this, it's likely on critical path
+                for row in result or []:
+                    self._critical_path_cache[row['tid']] = row.get('dependent_count', 0) > 2
+                for tid in pending:
+                    self._critical_path_cache.setdefault(tid, False)
+                    
+            except Exception as e:
+                self.logger.warning(f"Neo4j query failed for critical path: {e}")
+        
+        return {tid: self._critical_path_cache.get(tid, False) for tid in task_ids}
+    
+    def _is_critical_without_path(
+        self,
+        affected_tasks_count: int,
+        total_delay_days: int
+    ) -> bool:
+        """Check if the impact is critical regardless of critical-path membership."""
+        return affected_tasks_count > 10 or total_delay_days > 20
     
     def _determine_impact_level(
         self,
@@ -606,7 +825,7 @@ class ImpactAnalyzer(SchedulerBase):
         has_critical_path: bool
     ) -> ImpactLevel:
         """Determine overall impact level."""
-        if affected_tasks_count > 10 or total_delay_days > 20 or has_critical_path:
+        if self._is_critical_without_path(affected_tasks_count, total_delay_days) or has_critical_path:
             return ImpactLevel.CRITICAL
         elif affected_tasks_count > 5 or total_delay_days > 10:
             return ImpactLevel.HIGH
@@ -650,13 +869,11 @@ class ImpactAnalyzer(SchedulerBase):
     
     def _calculate_leave_cost_impact(
         self,
-        session: Session,
-        affected_tasks: List[Dict],
+        total_hours: float,
         leave_days: int
     ) -> Dict[str, Any]:
-        """Calculate cost impact of leave."""
+        """Calculate cost impact of leave from the affected tasks' planned hours."""
         # This is a simplified calculation
-        total_hours = sum(t.get('planned_hours', 0) for t in affected_tasks)
         
         # Assume average cost per hour
         avg_hourly_rate = 75  # Would be fetched from config or person data
@@ -667,25 +884,44 @@ class ImpactAnalyzer(SchedulerBase):
             'notes': 'Cost impact includes potential delays and reassignment overhead'
         }
     
+    def _sum_linked_field(
+        self,
+        session: Session,
+        source_id: str,
+        link_type_id: str,
+        json_field: str
+    ) -> float:
+        """Sum a numeric data field over the objects linked from a source, in SQL."""
+        stmt = select(
+            func.coalesce(func.sum(ObjectModel.data[json_field].as_float()), 0)
+        ).join(
+            LinkModel, LinkModel.target_id == ObjectModel.id
+        ).where(
+            and_(
+                LinkModel.source_id == source_id,
+                LinkModel.type_id == link_type_id,
+                ObjectModel.status != 'deleted'
+            )
+        )
+        return float(session.execute(stmt).scalar_one())
+    
     def _check_resource_availability(
         self,
         session: Session,
         project_id: str,
-        added_tasks: List[Dict]
+        added_tasks: List[Dict],
+        current_hours: Optional[float] = None
     ) -> List[Dict]:
         """Check if resources are available for added tasks."""
         # Simplified - in production would check actual capacity
         conflicts = []
         
         # Get current team allocations
-        project_tasks = self.get_linked_objects(
-            session, project_id, link_type_id='lt_project_has_task'
-        )
-        
-        total_allocated_hours = sum(
-            t['object'].data.get('estimated_hours', 0)
-            for t in project_tasks
-        )
+        total_allocated_hours = current_hours
+        if total_allocated_hours is None:
+            total_allocated_hours = self._sum_linked_field(
+                session, project_id, 'lt_project_has_task', 'estimated_hours'
+            )
         
         new_task_hours = sum(t.get('estimated_hours', 0) for t in added_tasks)
         
@@ -703,128 +939,285 @@ class ImpactAnalyzer(SchedulerBase):
     def _get_person_assignments(
         self,
         session: Session,
-        person_id: str
-    ) -> List[ObjectModel]:
-        """Get all assignments for a person."""
-        stmt = select(LinkModel).where(
-            and_(
-                LinkModel.type_id == 'lt_assignment_to_person',
-                LinkModel.target_id == person_id
-            )
-        )
-        links = session.scalars(stmt).all()
+        person_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[AssignmentRow]:
+        """
+        Stream all assignments for a person from a single JOIN query.
+        
+        Rows are fetched in batches rather than materialized up front, and
+        only the scalar fields the analyzer reads are projected, so people
+        with long assignment histories don't spike memory.
         
-        assignments = []
-        for link in links:
-            assignment = self.get_object_by_id(session, link.source_id)
-            if assignment and assignment.status != 'deleted':
-                assignments.append(assignment)
+        When both dates are given, only assignments whose planned day range
+        could overlap the period are returned. The filter compares ISO day
+        prefixes with a day of slack on each side so UTC offsets never drop
+        a real overlap; callers apply the exact check.
+        """
+        if start_date is not None and end_date is not None:
+            rows = session.execute(_PERSON_ASSIGNMENTS_IN_PERIOD_STMT, {
+                'person_id': person_id,
+                'earliest_end': (start_date.date() - timedelta(days=1)).isoformat(),
+                'latest_start': (end_date.date() + timedelta(days=2)).isoformat()
+            })
+        else:
+            rows = session.execute(_PERSON_ASSIGNMENTS_STMT, {'person_id': person_id})
         
-        return assignments
+        return map(AssignmentRow._make, rows)
     
-    def _assignments_overlap(
+    def _find_overallocated_pairs(
         self,
-        assign1: ObjectModel,
-        assign2: ObjectModel
-    ) -> bool:
-        """Check if two assignments overlap in time."""
-        start1 = assign1.data.get('planned_start')
-        end1 = assign1.data.get('planned_end')
-        start2 = assign2.data.get('planned_start')
-        end2 = assign2.data.get('planned_end')
+        assignments: List[AssignmentRow]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find overlapping assignment pairs whose allocations exceed 100%.
         
-        if not all([start1, end1, start2, end2]):
-            return False
+        Sweeps assignments in start order, keeping a heap of those still
+        running, so each assignment is only compared with the ones it
+        actually overlaps instead of every other assignment. Bounds are
+        compared as integer epoch seconds, which is cheaper than datetimes.
+        """
+        parsed = {}
+        for index, assignment in enumerate(assignments):
+            period = self._parse_assignment_period(assignment)
+            if period:
+                parsed[index] = period
+        periods = sorted(
+            (
+                (_epoch_seconds(start), _epoch_seconds(end), index)
+                for index, (start, end) in parsed.items()
+            ),
+            key=lambda p: p[0]
+        )
         
-        # Parse dates if strings
-        for date_val in [start1, end1, start2, end2]:
-            if isinstance(date_val, str):
-                date_val = datetime.fromisoformat(date_val.replace('Z', '+00:00'))
+        pairs = []
+        active: List[tuple] = []  # heap of (end, index, start) still running
+        for start, end, index in periods:
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for _, other_index, other_start in active:
+                # Guards against assignments that end before they start
+                if other_start <= end:
+                    pairs.append((min(index, other_index), max(index, other_index)))
+            heapq.heappush(active, (end, index, start))
         
-        return start1 <= end2 and start2 <= end1
+        conflicts = []
+        for i, j in sorted(pairs):
+            assign1, assign2 = assignments[i], assignments[j]
+            total_allocation = (
+                (assign1.allocation_percent or 0) +
+                (assign2.allocation_percent or 0)
+            )
+            if total_allocation > 100:
+                conflicts.append({
+                    'assignment1': assign1.id,
+                    'assignment2': assign2.id,
+                    'date_range': self._get_overlap_period(parsed[i], parsed[j]),
+                    'total_allocation': total_allocation,
+                    'excess': total_allocation - 100
+                })
+        
+        return conflicts
+    
+    def _parse_assignment_period(
+        self,
+        assignment: AssignmentRow
+    ) -> Optional[tuple]:
+        """Get an assignment's (start, end) as datetimes, or None if either is unset."""
+        bounds = []
+        for key in ('planned_start', 'planned_end'):
+            value = getattr(assignment, key)
+            if not value:
+                return None
+            bounds.append(self._as_utc_naive(value))
+        return bounds[0], bounds[1]
     
     def _get_overlap_period(
         self,
-        assign1: ObjectModel,
-        assign2: ObjectModel
+        period1: tuple,
+        period2: tuple
     ) -> Dict[str, str]:
-        """Get the overlap period between two assignments."""
-        start1 = assign1.data.get('planned_start')
-        end1 = assign1.data.get('planned_end')
-        start2 = assign2.data.get('planned_start')
-        end2 = assign2.data.get('planned_end')
-        
+        """Get the overlap between two parsed (start, end) periods."""
         return {
-            'start': max(str(start1), str(start2)),
-            'end': min(str(end1), str(end2))
+            'start': max(period1[0], period2[0]).isoformat(),
+            'end': min(period1[1], period2[1]).isoformat()
         }
     
-    def _check_person_capacity(
+    def _bulk_load_person_skills(
         self,
         session: Session,
-        person_id: str
-    ) -> bool:
-        """Check if person has capacity for new work."""
-        # Simplified - would check actual allocation %
-        assignments = self._get_person_assignments(session, person_id)
+        person_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Get skill_id -> proficiency maps for several people in one query.
         
-        total_allocation = sum(
-            a.data.get('allocation_percent', 0)
-            for a in assignments
-        )
+        Maps are cached per person; only people missing from the cache are
+        queried, and callers get copies. Nothing in this process writes
+        lt_person_has_skill links, so the 30s TTL is the only freshness
+        guarantee: granted or removed skills show up once the entry expires.
+        """
+        person_skills: Dict[str, Dict[str, int]] = {}
+        missing = []
+        for person_id in dict.fromkeys(person_ids):
+            cached = _person_skills_cache.get(person_id)
+            if cached is None:
+                missing.append(person_id)
+            elif cached:
+                person_skills[person_id] = dict(cached)
         
-        return total_allocation < 80  # Has capacity if < 80% allocated
+        if not missing:
+            return person_skills
+        
+        loaded: Dict[str, Dict[str, int]] = {person_id: {} for person_id in missing}
+        rows = session.execute(_PERSON_SKILLS_STMT, {'person_ids': missing})
+        for person_id, link_data, skill_id in rows:
+            loaded[person_id][skill_id] = (link_data or {}).get('proficiency_level', 1)
+        
+        for person_id, skill_map in loaded.items():
+            _person_skills_cache.set(person_id, skill_map)
+            if skill_map:
+                person_skills[person_id] = dict(skill_map)
+        
+        return person_skills
     
     def _calculate_skill_match(
         self,
         session: Session,
         person_id: str,
-        skill_requirements: List[Dict]
+        skill_requirements: List[Dict],
+        person_skill_map: Optional[Dict[str, int]] = None,
+        requirements: Optional[SkillRequirements] = None
     ) -> Dict[str, Any]:
-        """Calculate how well a person matches skill requirements."""
+        """
+        Calculate how well a person matches skill requirements.
+        
+        Callers scoring several people against the same requirements can
+        pass the output of _materialize_requirements as requirements.
+        """
         if not skill_requirements:
             return {'score': 100, 'matches': [], 'missing': []}
         
-        # Get person's skills
-        person_skills = self.get_linked_objects(
-            session, person_id, link_type_id='lt_person_has_skill'
-        )
+        # Get person's skills unless they were preloaded
+        if person_skill_map is None:
+            person_skills = self.get_linked_objects(
+                session, person_id, link_type_id='lt_person_has_skill'
+            )
+            
+            skill_ids = [s['object'].data.get('skill_id') for s in person_skills]
+            proficiency = [s['link_data'].get('proficiency_level', 1) for s in person_skills]
+            person_skill_map = dict(zip(skill_ids, proficiency, strict=True))
         
-        person_skill_map = {
-            s['object'].data.get('skill_id'): s['link_data'].get('proficiency_level', 1)
-            for s in person_skills
-        }
+        # Requirements and the person's levels as parallel arrays
+        if requirements is None:
+            requirements = self._materialize_requirements(skill_requirements)
+        req_ids = requirements.skill_ids
+        req_levels = requirements.min_levels
+        person_levels = [person_skill_map.get(skill_id, 0) for skill_id in req_ids]
         
-        matches = []
-        missing = []
-        total_score = 0
+        levels = np.array(person_levels, dtype=np.float64)
+        required = np.array(req_levels, dtype=np.float64)
+        matched = levels >= required
         
-        for req in skill_requirements:
-            req_skill_id = req['object'].data.get('skill_id')
-            req_level = req['object'].data.get('minimum_proficiency', 1)
-            
-            person_level = person_skill_map.get(req_skill_id, 0)
-            
-            if person_level >= req_level:
-                matches.append({
-                    'skill_id': req_skill_id,
-                    'required': req_level,
-                    'actual': person_level
-                })
-                total_score += 100
-            else:
-                missing.append({
-                    'skill_id': req_skill_id,
-                    'required': req_level,
-                    'actual': person_level
-                })
-                if person_level > 0:
-                    total_score += (person_level / req_level) * 50
+        def details(indices) -> List[Dict[str, Any]]:
+            return [
+                {
+                    'skill_id': req_ids[i],
+                    'required': req_levels[i],
+                    'actual': person_levels[i]
+                }
+                for i in indices
+            ]
+        
+        # Full matches and people with none of the skills need no scoring
+        if matched.all():
+            return {
+                'score': 100.0,
+                'matches': details(range(len(req_ids))),
+                'missing': []
+            }
+        if not matched.any() and not (levels > 0).any():
+            return {
+                'score': 0.0,
+                'matches': [],
+                'missing': details(range(len(req_ids)))
+            }
         
-        avg_score = total_score / len(skill_requirements) if skill_requirements else 100
+        avg_score = float(self._score_skill_levels(levels[np.newaxis, :], required)[0])
         
         return {
             'score': round(avg_score, 2),
-            'matches': matches,
-            'missing': missing
+            'matches': details(np.flatnonzero(matched)),
+            'missing': details(np.flatnonzero(~matched))
         }
+    
+    def _calculate_skill_match_batch(
+        self,
+        session: Session,
+        person_ids: List[str],
+        skill_requirements: List[Dict],
+        person_skills: Optional[Dict[str, Dict[str, int]]] = None,
+        requirements: Optional[SkillRequirements] = None
+    ) -> np.ndarray:
+        """
+        Score several people against the same skill requirements at once.
+        
+        Returns the unrounded match scores aligned with person_ids, built
+        from one (people, requirements) matrix of proficiency levels.
+        """
+        if requirements is None:
+            requirements = self._materialize_requirements(skill_requirements)
+        req_skill_ids = requirements.skill_ids
+        
+        if person_skills is None:
+            person_skills = self._bulk_load_person_skills(session, person_ids)
+        
+        columns: Dict[str, List[int]] = {}
+        for col, skill_id in enumerate(req_skill_ids):
+            columns.setdefault(skill_id, []).append(col)
+        
+        rows = []
+        cols = []
+        values = []
+        for row, person_id in enumerate(person_ids):
+            for skill_id, level in person_skills.get(person_id, {}).items():
+                for col in columns.get(skill_id, ()):
+                    rows.append(row)
+                    cols.append(col)
+                    values.append(level)
+        
+        levels = np.zeros((len(person_ids), len(req_skill_ids)), dtype=np.float64)
+        levels[rows, cols] = values
+        
+        return self._score_skill_levels(levels, np.array(requirements.min_levels, dtype=np.float64))
+    
+    def _materialize_requirements(
+        self,
+        skill_requirements: List[Dict]
+    ) -> SkillRequirements:
+        """Split skill requirements into parallel skill_id and minimum level tuples."""
+        datas = list(map(attrgetter('data'), map(itemgetter('object'), skill_requirements)))
+        return SkillRequirements(
+            tuple(data.get('skill_id') for data in datas),
+            tuple(data.get('minimum_proficiency', 1) for data in datas)
+        )
+    
+    def _score_skill_levels(
+        self,
+        levels: np.ndarray,
+        required: np.ndarray
+    ) -> np.ndarray:
+        """
+        Average skill match score per row of a (people, requirements) matrix.
+        
+        A met requirement scores 100; an unmet one earns partial credit of
+        50 scaled by how close the person's level is to the minimum.
+        """
+        if levels.shape[1] == 0:
+            return np.full(levels.shape[0], 100.0)
+        
+        # One division per requirement, then a multiply per cell
+        with np.errstate(divide='ignore', invalid='ignore'):
+            partial_per_level = 50.0 / required
+            partial = np.where(levels > 0, levels * partial_per_level, 0.0)
+        return np.where(levels >= required, 100.0, partial).mean(axis=1)
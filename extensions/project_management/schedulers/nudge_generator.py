@@ -20,19 +20,160 @@ Usage:
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Set
+from collections import Counter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
+import os
 import uuid
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, insert, and_, or_, func, bindparam, exists
+from sqlalchemy.orm import aliased
 
 from .base import SchedulerBase, ObjectModel, LinkModel, Session
 
 logger = logging.getLogger(__name__)
 
 
+class PersonRow(NamedTuple):
+    """Fields of an active person that the detectors read."""
+    id: str
+    name: Optional[str]
+    manager_id: Optional[str]
+
+
+# Only the fields the detectors read, so people come back as plain tuples
+_ACTIVE_PEOPLE_STMT = select(
+    ObjectModel.id,
+    ObjectModel.data['name'].as_string(),
+    ObjectModel.data['manager_id'].as_string()
+).where(
+    and_(
+        ObjectModel.type_id == 'ot_person',
+        ObjectModel.status == 'active'
+    )
+).limit(1000)
+
+# Active tasks whose predicted delay probability reaches :threshold
+_DELAY_RISK_TASKS_STMT = select(ObjectModel).where(
+    and_(
+        ObjectModel.type_id == 'ot_task',
+        ObjectModel.status != 'deleted',
+        ObjectModel.data['status'].as_string().in_(['todo', 'in_progress']),
+        ObjectModel.data['predicted_delay_probability'].as_float() >= bindparam('threshold')
+    )
+).limit(1000)
+
+# Skill requirement and assignment links for a batch of tasks
+_TASK_LINK_CONTEXT_STMT = select(
+    LinkModel.source_id, LinkModel.type_id, LinkModel.data, ObjectModel
+).join(
+    ObjectModel, LinkModel.target_id == ObjectModel.id
+).where(
+    and_(
+        LinkModel.source_id.in_(bindparam('task_ids', expanding=True)),
+        LinkModel.type_id.in_(['lt_task_requires_skill', 'lt_task_assigned_to']),
+        ObjectModel.status != 'deleted'
+    )
+)
+
+# Mean allocation_percent over each person's assignments; a missing
+# allocation counts as 0, and people without assignments are omitted
+_AVERAGE_ALLOCATIONS_STMT = select(
+    LinkModel.target_id,
+    func.avg(func.coalesce(ObjectModel.data['allocation_percent'].as_float(), 0))
+).join(
+    ObjectModel, LinkModel.source_id == ObjectModel.id
+).where(
+    and_(
+        LinkModel.type_id == 'lt_assignment_to_person',
+        LinkModel.target_id.in_(bindparam('person_ids', expanding=True)),
+        ObjectModel.status != 'deleted'
+    )
+).group_by(LinkModel.target_id)
+
+# (recipient_id, related_task_id, type) of nudges created since :cutoff
+_RECENT_NUDGE_KEYS_STMT = select(
+    ObjectModel.data['recipient_id'].as_string(),
+    ObjectModel.data['related_task_id'].as_string(),
+    ObjectModel.data['related_person_id'].as_string(),
+    ObjectModel.data['type'].as_string()
+).where(
+    and_(
+        ObjectModel.type_id == 'ot_nudge',
+        ObjectModel.data['recipient_id'].as_string().in_(
+            bindparam('recipient_ids', expanding=True)
+        ),
+        ObjectModel.created_at >= bindparam('cutoff')
+    )
+)
+
+_PEOPLE_SKILLS_STMT = select(
+    LinkModel.source_id,
+    LinkModel.data,
+    ObjectModel.data['skill_id'].as_string()
+).join(
+    ObjectModel, LinkModel.target_id == ObjectModel.id
+).where(
+    and_(
+        LinkModel.type_id == 'lt_person_has_skill',
+        LinkModel.source_id.in_(bindparam('person_ids', expanding=True)),
+        ObjectModel.status != 'deleted'
+    )
+)
+
+_assignment = aliased(ObjectModel)
+_task_assignment_link = aliased(LinkModel)
+
+# People reached from :task_id through task -> assignment -> person
+_TASK_ASSIGNEES_STMT = select(
+    ObjectModel.id,
+    ObjectModel.data['name'].as_string()
+).select_from(_task_assignment_link).join(
+    _assignment, _task_assignment_link.target_id == _assignment.id
+).join(
+    LinkModel, LinkModel.source_id == _assignment.id
+).join(
+    ObjectModel, LinkModel.target_id == ObjectModel.id
+).where(
+    and_(
+        _task_assignment_link.source_id == bindparam('task_id'),
+        _task_assignment_link.type_id == 'lt_task_assigned_to',
+        _assignment.status != 'deleted',
+        LinkModel.type_id == 'lt_assignment_to_person',
+        ObjectModel.status != 'deleted'
+    )
+)
+
+_assigned_task = aliased(ObjectModel)
+
+# Todo tasks scoring at least :threshold with no live assignment
+_AVAILABLE_HIGH_PRIORITY_TASKS_STMT = select(ObjectModel).where(
+    and_(
+        ObjectModel.type_id == 'ot_task',
+        ObjectModel.status == 'todo',
+        ObjectModel.data['priority_score'].as_float() >= bindparam('threshold'),
+        ~exists().where(
+            and_(
+                LinkModel.source_id == ObjectModel.id,
+                LinkModel.type_id == 'lt_task_assigned_to',
+                LinkModel.target_id == _assigned_task.id,
+                _assigned_task.status != 'deleted'
+            )
+        ).correlate(ObjectModel)
+    )
+).limit(1000)
+
+
+def _uuid4_batch(count: int) -> Iterator[str]:
+    """Yield count random (version 4) UUID strings from one urandom read."""
+    buf = os.urandom(16 * count)
+    for offset in range(0, 16 * count, 16):
+        yield str(uuid.UUID(bytes=buf[offset:offset + 16], version=4))
+
+
 class NudgeType(str, Enum):
     """Types of nudges."""
     RISK = "risk"
@@ -48,7 +189,30 @@ class NudgeSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Importance weights used by rank_nudges
+_SEVERITY_MULTIPLIERS = {
+    NudgeSeverity.CRITICAL: 2.0,
+    NudgeSeverity.WARNING: 1.5,
+    NudgeSeverity.INFO: 1.0
+}
+
+# Risks and conflicts are more urgent
+_TYPE_WEIGHTS = {
+    NudgeType.RISK: 1.3,
+    NudgeType.CONFLICT: 1.2,
+    NudgeType.SUGGESTION: 1.0,
+    NudgeType.OPPORTUNITY: 0.9
+}
+
+# Severity ordering for threshold filtering (lowest first)
+SEVERITY_RANK = {
+    NudgeSeverity.INFO: 0,
+    NudgeSeverity.WARNING: 1,
+    NudgeSeverity.CRITICAL: 2
+}
+
+
+@dataclass(slots=True)
 class NudgeCandidate:
     """Candidate nudge before persistence."""
     type: NudgeType
@@ -62,6 +226,8 @@ class NudgeCandidate:
     context_data: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 0.5
     suggested_actions: List[Dict[str, Any]] = field(default_factory=list)
+    # Set by NudgeGenerator.rank_nudges
+    importance: float = field(default=0.0, init=False, compare=False)
 
 
 class NudgeGenerator(SchedulerBase):
@@ -141,12 +307,8 @@ class NudgeGenerator(SchedulerBase):
         ranked = self.rank_nudges(all_candidates)
         
         # Filter by severity threshold
-        severity_order = ["info", "warning", "critical"]
-        min_index = severity_order.index(severity_threshold)
-        filtered = [
-            n for n in ranked
-            if severity_order.index(n.severity.value) >= min_index
-        ]
+        min_rank = SEVERITY_RANK[NudgeSeverity(severity_threshold)]
+        filtered = [n for n in ranked if SEVERITY_RANK[n.severity] >= min_rank]
         
         # Deduplicate
         deduplicated = self._deduplicate_nudges(filtered)
@@ -159,16 +321,26 @@ class NudgeGenerator(SchedulerBase):
         skipped_count = 0
         
         with self.get_session() as session:
+            existing = self._get_recent_nudge_keys(session, final_candidates)
+            ids = _uuid4_batch(
+                sum(1 + len(c.suggested_actions) for c in final_candidates)
+            )
+            rows = []
+            
             for candidate in final_candidates:
                 try:
-                    if self._should_create_nudge(session, candidate):
-                        self._create_nudge_object(session, candidate)
+                    if self._should_create_nudge(candidate, existing):
+                        rows.extend(self._build_nudge_rows(candidate, ids))
+                        existing.add(self._nudge_key(candidate))
                         created_count += 1
                     else:
                         skipped_count += 1
                 except Exception as e:
                     self.logger.error(f"Error creating nudge: {e}")
             
+            # Nudges and their actions go in as one multi-row insert
+            if rows:
+                session.execute(insert(ObjectModel), rows)
             session.commit()
         
         self.logger.info(
@@ -197,7 +369,10 @@ class NudgeGenerator(SchedulerBase):
         
         with self.get_session() as session:
             # Find tasks with high delay probability
-            tasks = self.get_objects_by_type(session, 'ot_task', limit=1000)
+            tasks = self._get_delay_risk_tasks(session)
+            projects = self.get_objects_by_ids(
+                session, (task.data.get('project_id') for task in tasks)
+            )
             
             for task in tasks:
                 delay_prob = task.data.get('predicted_delay_probability', 0)
@@ -215,7 +390,7 @@ class NudgeGenerator(SchedulerBase):
                     
                     # Get project info
                     project_id = task.data.get('project_id')
-                    project = self.get_object_by_id(session, project_id) if project_id else None
+                    project = projects.get(project_id) if project_id else None
                     
                     # Get assignee info
                     assignees = self._get_task_assignees(session, task.id)
@@ -266,7 +441,7 @@ class NudgeGenerator(SchedulerBase):
         
         with self.get_session() as session:
             # Get all active people
-            people = self.get_objects_by_type(session, 'ot_person', status='active')
+            people = self._get_active_people(session)
             
             for person in people:
                 person_id = person.id
@@ -290,13 +465,13 @@ class NudgeGenerator(SchedulerBase):
                         candidate = NudgeCandidate(
                             type=NudgeType.CONFLICT,
                             severity=severity,
-                            title=f"Resource conflict: {person.data.get('name')} overallocated",
+                            title=f"Resource conflict: {person.name} overallocated",
                             description=(
-                                f"{person.data.get('name')} is allocated at "
+                                f"{person.name} is allocated at "
                                 f"{total_allocation:.0f}% during {date_range}. "
                                 f"This exceeds capacity by {excess:.0f}%."
                             ),
-                            recipient_id=person.data.get('manager_id') or person_id,
+                            recipient_id=person.manager_id or person_id,
                             related_person_id=person_id,
                             context_data={
                                 'allocation_percent': total_allocation,
@@ -328,67 +503,69 @@ class NudgeGenerator(SchedulerBase):
         with self.get_session() as session:
             # Find unassigned tasks with skill requirements
             tasks = self.get_objects_by_type(session, 'ot_task', limit=500)
+            skill_reqs_by_task, assigned_task_ids = self._bulk_fetch_task_link_context(
+                session, [task.id for task in tasks]
+            )
             
+            # Active people and their skills are loaded once, on first need
+            people_skills = None
+            gaps = []
             for task in tasks:
-                # Check if task has skill requirements
-                skill_reqs = self.get_linked_objects(
-                    session, task.id, link_type_id='lt_task_requires_skill'
-                )
-                
-                if not skill_reqs:
+                skill_reqs = skill_reqs_by_task.get(task.id)
+                if not skill_reqs or task.id in assigned_task_ids:
                     continue
                 
-                # Check if task is unassigned
-                assignments = self.get_linked_objects(
-                    session, task.id, link_type_id='lt_task_assigned_to'
-                )
-                
-                if assignments:
-                    continue  # Already assigned
+                if people_skills is None:
+                    people_skills = self._load_people_skills(session)
                 
                 # Check for qualified people
-                qualified_people = self._find_qualified_people(session, skill_reqs)
+                if not self._find_qualified_people(session, skill_reqs, people_skills):
+                    gaps.append((task, skill_reqs))
+            
+            skills = self.get_objects_by_ids(
+                session,
+                (req['object'].data.get('skill_id') for _, reqs in gaps for req in reqs)
+            )
+            projects = self.get_objects_by_ids(
+                session, (task.data.get('project_id') for task, _ in gaps)
+            )
+            
+            for task, skill_reqs in gaps:
+                # No one has the required skills
+                skill_names = []
+                for req in skill_reqs:
+                    skill = skills.get(req['object'].data.get('skill_id'))
+                    skill_names.append(skill.data.get('name', 'Unknown') if skill else 'Unknown')
+                
+                project_id = task.data.get('project_id')
+                project = projects.get(project_id) if project_id else None
                 
-                if not qualified_people:
-                    # No one has the required skills
-                    skill_names = [
-                        self.get_object_by_id(
-                            session, req['object'].data.get('skill_id')
-                        ).data.get('name', 'Unknown') if self.get_object_by_id(
-                            session, req['object'].data.get('skill_id')
-                        ) else 'Unknown'
-                        for req in skill_reqs
+                candidate = NudgeCandidate(
+                    type=NudgeType.SUGGESTION,
+                    severity=NudgeSeverity.WARNING,
+                    title=f"Skill gap: No qualified resource for '{task.data.get('title', 'Unknown')[:40]}'",
+                    description=(
+                        f"Task '{task.data.get('title')}' requires skills "
+                        f"that no available team member possesses: "
+                        f"{', '.join(skill_names)}. Consider training or hiring."
+                    ),
+                    recipient_id=project.data.get('pm_id') if project else None,
+                    related_project_id=project_id,
+                    related_task_id=task.id,
+                    context_data={
+                        'required_skills': skill_names,
+                        'task_priority': task.data.get('priority')
+                    },
+                    confidence=0.9,
+                    suggested_actions=[
+                        {'type': 'train', 'description': 'Arrange skill training'},
+                        {'type': 'outsource', 'description': 'Consider outsourcing'},
+                        {'type': 'hire', 'description': 'Hire for required skills'}
                     ]
-                    
-                    project_id = task.data.get('project_id')
-                    project = self.get_object_by_id(session, project_id) if project_id else None
-                    
-                    candidate = NudgeCandidate(
-                        type=NudgeType.SUGGESTION,
-                        severity=NudgeSeverity.WARNING,
-                        title=f"Skill gap: No qualified resource for '{task.data.get('title', 'Unknown')[:40]}'",
-                        description=(
-                            f"Task '{task.data.get('title')}' requires skills "
-                            f"that no available team member possesses: "
-                            f"{', '.join(skill_names)}. Consider training or hiring."
-                        ),
-                        recipient_id=project.data.get('pm_id') if project else None,
-                        related_project_id=project_id,
-                        related_task_id=task.id,
-                        context_data={
-                            'required_skills': skill_names,
-                            'task_priority': task.data.get('priority')
-                        },
-                        confidence=0.9,
-                        suggested_actions=[
-                            {'type': 'train', 'description': 'Arrange skill training'},
-                            {'type': 'outsource', 'description': 'Consider outsourcing'},
-                            {'type': 'hire', 'description': 'Hire for required skills'}
-                        ]
-                    )
-                    
-                    if candidate.recipient_id:
-                        candidates.append(candidate)
+                )
+                
+                if candidate.recipient_id:
+                    candidates.append(candidate)
         
         self.logger.info(f"Detected {len(candidates)} skill gaps")
         return candidates
@@ -404,13 +581,15 @@ class NudgeGenerator(SchedulerBase):
         
         with self.get_session() as session:
             # Check for people with high allocation for extended periods
-            people = self.get_objects_by_type(session, 'ot_person', status='active')
+            people = self._get_active_people(session)
+            
+            # Check allocation over last 4 weeks
+            allocations = self._calculate_average_allocations(
+                session, [person.id for person in people], weeks=4
+            )
             
             for person in people:
-                # Check allocation over last 4 weeks
-                avg_allocation = self._calculate_average_allocation(
-                    session, person.id, weeks=4
-                )
+                avg_allocation = allocations.get(person.id, 0.0)
                 
                 if avg_allocation >= self.BURNOUT_ALLOCATION_THRESHOLD:
                     if avg_allocation >= 100:
@@ -423,14 +602,14 @@ class NudgeGenerator(SchedulerBase):
                     candidate = NudgeCandidate(
                         type=NudgeType.RISK,
                         severity=severity,
-                        title=f"Burnout risk: {person.data.get('name')} overallocated for 4+ weeks",
+                        title=f"Burnout risk: {person.name} overallocated for 4+ weeks",
                         description=(
-                            f"{person.data.get('name')} has been at "
+                            f"{person.name} has been at "
                             f"{avg_allocation:.0f}% average allocation for the past "
                             f"{self.BURNOUT_WEEKS_THRESHOLD} weeks. "
                             f"Consider redistributing workload to prevent burnout."
                         ),
-                        recipient_id=person.data.get('manager_id') or person.id,
+                        recipient_id=person.manager_id or person.id,
                         related_person_id=person.id,
                         context_data={
                             'average_allocation': avg_allocation,
@@ -460,29 +639,36 @@ class NudgeGenerator(SchedulerBase):
         
         with self.get_session() as session:
             # Find people with capacity for high-priority tasks
-            people = self.get_objects_by_type(session, 'ot_person', status='active')
+            people = self._get_active_people(session)
+            allocations = self._calculate_current_allocations(
+                session, [person.id for person in people]
+            )
+            
+            # The same open tasks apply to everyone; loaded once, on first need
+            available_tasks = None
             
             for person in people:
-                current_allocation = self._calculate_current_allocation(session, person.id)
+                current_allocation = allocations.get(person.id, 0.0)
                 
                 if current_allocation < self.UNDERUTILIZED_THRESHOLD:
                     available_capacity = 100 - current_allocation
                     
                     # Find high-priority tasks that could use this person
-                    available_tasks = self._find_available_high_priority_tasks(session)
+                    if available_tasks is None:
+                        available_tasks = self._find_available_high_priority_tasks(session)
                     
                     if available_tasks:
                         candidate = NudgeCandidate(
                             type=NudgeType.OPPORTUNITY,
                             severity=NudgeSeverity.INFO,
-                            title=f"Opportunity: {person.data.get('name')} has {available_capacity:.0f}% capacity",
+                            title=f"Opportunity: {person.name} has {available_capacity:.0f}% capacity",
                             description=(
-                                f"{person.data.get('name')} is currently at "
+                                f"{person.name} is currently at "
                                 f"{current_allocation:.0f}% allocation and could take on "
                                 f"additional work. {len(available_tasks)} high-priority "
                                 f"tasks are available for assignment."
                             ),
-                            recipient_id=person.data.get('manager_id') or person.id,
+                            recipient_id=person.manager_id or person.id,
                             related_person_id=person.id,
                             context_data={
                                 'available_capacity': available_capacity,
@@ -516,60 +702,65 @@ class NudgeGenerator(SchedulerBase):
             return candidates
         
         try:
-            # Query for tasks blocking many others
+            # Query for tasks blocking many others, with the owning
+            # project's PM resolved in the same round trip. Object data is
+            # stored as flattened node properties by the graph indexer.
             query = """
-            MATCH (t:Object {type_id: 'ot_task'})-[r:lt_task_blocks]->(blocked:Object)
-            WHERE t.data.status IN ['todo', 'in_progress'] 
-              AND blocked.data.status != 'done'
-            RETURN t.id as task_id, t.data as task_data,
-                   count(blocked) as blocked_count
-            HAVING count(blocked) >= 3
+            MATCH (t:Object {type_id: 'ot_task'})-[:lt_task_blocks]->(blocked:Object)
+            WHERE t.status IN $active_statuses
+              AND coalesce(blocked.status, '') <> 'done'
+            WITH t, count(blocked) AS blocked_count
+            WHERE blocked_count >= $min_blocked
+            OPTIONAL MATCH (p:Object {id: t.project_id})
+            RETURN t.id AS task_id, t {.title, .status, .project_id} AS task_data,
+                   blocked_count, p.pm_id AS pm_id
             """
             
-            results = self.neo4j.execute_read(query)
+            results = self.neo4j.execute_read(query, {
+                'active_statuses': ['todo', 'in_progress'],
+                'min_blocked': 3
+            })
             
-            with self.get_session() as session:
-                for result in results:
-                    blocked_count = result.get('blocked_count', 0)
-                    task_id = result.get('task_id')
-                    task_data = result.get('task_data', {})
-                    
-                    if blocked_count >= 5:
-                        severity = NudgeSeverity.CRITICAL
-                    elif blocked_count >= 3:
-                        severity = NudgeSeverity.WARNING
-                    else:
-                        continue
-                    
-                    project_id = task_data.get('project_id')
-                    project = self.get_object_by_id(session, project_id) if project_id else None
-                    
-                    candidate = NudgeCandidate(
-                        type=NudgeType.RISK,
-                        severity=severity,
-                        title=f"Bottleneck: Task blocking {blocked_count} other tasks",
-                        description=(
-                            f"Task '{task_data.get('title')}' is a critical dependency "
-                            f"for {blocked_count} other tasks. Any delay will cascade. "
-                            f"Consider prioritizing this task or adding resources."
-                        ),
-                        recipient_id=project.data.get('pm_id') if project else None,
-                        related_project_id=project_id,
-                        related_task_id=task_id,
-                        context_data={
-                            'blocked_count': blocked_count,
-                            'task_status': task_data.get('status')
-                        },
-                        confidence=min(blocked_count / 10, 1.0),
-                        suggested_actions=[
-                            {'type': 'prioritize', 'description': 'Prioritize this task'},
-                            {'type': 'add_resource', 'description': 'Add additional resources'},
-                            {'type': 'parallelize', 'description': 'Look for parallelization opportunities'}
-                        ]
-                    )
-                    
-                    if candidate.recipient_id:
-                        candidates.append(candidate)
+            for result in results:
+                blocked_count = result.get('blocked_count', 0)
+                task_id = result.get('task_id')
+                task_data = result.get('task_data') or {}
+                
+                if blocked_count >= 5:
+                    severity = NudgeSeverity.CRITICAL
+                elif blocked_count >= 3:
+                    severity = NudgeSeverity.WARNING
+                else:
+                    continue
+                
+                project_id = task_data.get('project_id')
+                
+                candidate = NudgeCandidate(
+                    type=NudgeType.RISK,
+                    severity=severity,
+                    title=f"Bottleneck: Task blocking {blocked_count} other tasks",
+                    description=(
+                        f"Task '{task_data.get('title')}' is a critical dependency "
+                        f"for {blocked_count} other tasks. Any delay will cascade. "
+                        f"Consider prioritizing this task or adding resources."
+                    ),
+                    recipient_id=result.get('pm_id'),
+                    related_project_id=project_id,
+                    related_task_id=task_id,
+                    context_data={
+                        'blocked_count': blocked_count,
+                        'task_status': task_data.get('status')
+                    },
+                    confidence=min(blocked_count / 10, 1.0),
+                    suggested_actions=[
+                        {'type': 'prioritize', 'description': 'Prioritize this task'},
+                        {'type': 'add_resource', 'description': 'Add additional resources'},
+                        {'type': 'parallelize', 'description': 'Look for parallelization opportunities'}
+                    ]
+                )
+                
+                if candidate.recipient_id:
+                    candidates.append(candidate)
         
         except Exception as e:
             self.logger.error(f"Error detecting bottlenecks: {e}")
@@ -591,36 +782,27 @@ class NudgeGenerator(SchedulerBase):
             nudges: List of nudge candidates
             
         Returns:
-            Sorted list (highest importance first)
+            Sorted list (highest importance first); each candidate's
+            importance is set to its computed score
         """
-        def calculate_importance(nudge: NudgeCandidate) -> float:
-            # Base score from confidence
-            score = nudge.confidence * 50
-            
-            # Severity multiplier
-            severity_multipliers = {
-                NudgeSeverity.CRITICAL: 2.0,
-                NudgeSeverity.WARNING: 1.5,
-                NudgeSeverity.INFO: 1.0
-            }
-            score *= severity_multipliers.get(nudge.severity, 1.0)
-            
-            # Type weighting (risks and conflicts are more urgent)
-            type_weights = {
-                NudgeType.RISK: 1.3,
-                NudgeType.CONFLICT: 1.2,
-                NudgeType.SUGGESTION: 1.0,
-                NudgeType.OPPORTUNITY: 0.9
-            }
-            score *= type_weights.get(nudge.type, 1.0)
+        severity_multipliers = _SEVERITY_MULTIPLIERS
+        type_weights = _TYPE_WEIGHTS
+        
+        for nudge in nudges:
+            # Base score from confidence, weighted by severity and type
+            score = (
+                nudge.confidence * 50
+                * severity_multipliers.get(nudge.severity, 1.0)
+                * type_weights.get(nudge.type, 1.0)
+            )
             
             # Boost for critical project tasks
             if nudge.context_data.get('task_priority') == 'critical':
                 score *= 1.5
             
-            return score
+            nudge.importance = score
         
-        return sorted(nudges, key=calculate_importance, reverse=True)
+        return sorted(nudges, key=attrgetter('importance'), reverse=True)
     
     def _deduplicate_nudges(
         self,
@@ -639,13 +821,12 @@ class NudgeGenerator(SchedulerBase):
         
         for nudge in nudges:
             # Create a deduplication key
-            key_parts = [
+            key = (
                 nudge.recipient_id,
-                nudge.type.value,
+                nudge.type,
                 nudge.related_task_id or nudge.related_person_id or '',
                 nudge.title[:30]  # First 30 chars of title
-            ]
-            key = '|'.join(str(p) for p in key_parts)
+            )
             
             if key not in seen_keys:
                 seen_keys.add(key)
@@ -653,37 +834,71 @@ class NudgeGenerator(SchedulerBase):
         
         return deduplicated
     
-    def _should_create_nudge(
+    def _get_recent_nudge_keys(
         self,
         session: Session,
-        candidate: NudgeCandidate
-    ) -> bool:
+        candidates: List[NudgeCandidate]
+    ) -> Set[Tuple[str, str, str]]:
         """
-        Check if a similar nudge already exists (prevent spam).
+        Get keys of nudges created within the dedup window, in one query.
+        
+        Only nudges for the candidates' recipients are fetched.
         """
-        # Look for similar recent nudges
+        recipient_ids = {c.recipient_id for c in candidates if c.recipient_id}
+        if not recipient_ids:
+            return set()
+        
         cutoff_time = self.now() - timedelta(hours=self.DEDUP_WINDOW_HOURS)
+        rows = session.execute(_RECENT_NUDGE_KEYS_STMT, {
+            'recipient_ids': list(recipient_ids),
+            'cutoff': cutoff_time
+        })
+        return {
+            (recipient_id, related_task_id or related_person_id or '', nudge_type)
+            for recipient_id, related_task_id, related_person_id, nudge_type in rows
+        }
+    
+    def _nudge_key(self, candidate: NudgeCandidate) -> Tuple[str, str, str]:
+        """
+        Key used to match a candidate against recently created nudges.
         
-        existing = session.scalars(
-            select(ObjectModel).where(
-                and_(
-                    ObjectModel.type_id == 'ot_nudge',
-                    ObjectModel.data['recipient_id'].astext == candidate.recipient_id,
-                    ObjectModel.data['related_task_id'].astext == (candidate.related_task_id or ''),
-                    ObjectModel.data['type'].astext == candidate.type.value,
-                    ObjectModel.created_at >= cutoff_time
-                )
-            )
-        ).first()
+        Taskless nudges (e.g. burnout risks) are told apart by the related
+        person, as in _deduplicate_nudges.
+        """
+        return (
+            candidate.recipient_id,
+            candidate.related_task_id or candidate.related_person_id or '',
+            candidate.type.value
+        )
+    
+    def _should_create_nudge(
+        self,
+        candidate: NudgeCandidate,
+        existing: Set[Tuple[str, str, str]]
+    ) -> bool:
+        """
+        Check if a similar nudge already exists (prevent spam).
         
-        return existing is None
+        Args:
+            candidate: Nudge about to be created
+            existing: Keys from _get_recent_nudge_keys
+        """
+        return self._nudge_key(candidate) not in existing
     
-    def _create_nudge_object(
+    def _build_nudge_rows(
         self,
-        session: Session,
-        candidate: NudgeCandidate
-    ) -> ObjectModel:
-        """Create the nudge object in the database."""
+        candidate: NudgeCandidate,
+        ids: Optional[Iterator[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build object rows for a nudge and its suggested actions.
+        
+        The nudge row comes first; rows are inserted in bulk by the caller.
+        Row ids are drawn from ids when given (see _uuid4_batch).
+        """
+        if ids is None:
+            ids = _uuid4_batch(1 + len(candidate.suggested_actions))
+        nudge_id = next(ids)
         nudge_data = {
             'type': candidate.type.value,
             'severity': candidate.severity.value,
@@ -699,37 +914,34 @@ class NudgeGenerator(SchedulerBase):
             'created_at': self.now().isoformat()
         }
         
-        nudge = ObjectModel(
-            id=str(uuid.uuid4()),
-            type_id='ot_nudge',
-            data=nudge_data,
-            status='active'
-        )
-        
-        session.add(nudge)
+        rows = [{
+            'id': nudge_id,
+            'type_id': 'ot_nudge',
+            'data': nudge_data,
+            'status': 'active'
+        }]
         
         # Create suggested actions
         for action in candidate.suggested_actions:
             action_data = {
-                'nudge_id': nudge.id,
+                'nudge_id': nudge_id,
                 'action_type': action.get('type', 'custom'),
                 'description': action.get('description', ''),
                 'is_automatable': action.get('type') in ['reassign', 'extend'],
                 'was_executed': False
             }
             
-            action_obj = ObjectModel(
-                id=str(uuid.uuid4()),
-                type_id='ot_nudge_action',
-                data=action_data,
-                status='active'
-            )
-            session.add(action_obj)
+            rows.append({
+                'id': next(ids),
+                'type_id': 'ot_nudge_action',
+                'data': action_data,
+                'status': 'active'
+            })
             
             # Create link between nudge and action
             # (In production, use proper link creation)
         
-        return nudge
+        return rows
     
     def _get_task_assignees(
         self,
@@ -737,24 +949,8 @@ class NudgeGenerator(SchedulerBase):
         task_id: str
     ) -> List[Dict[str, Any]]:
         """Get people assigned to a task."""
-        assignments = self.get_linked_objects(
-            session, task_id, link_type_id='lt_task_assigned_to'
-        )
-        
-        assignees = []
-        for assignment in assignments:
-            # Get person from assignment
-            person_links = self.get_linked_objects(
-                session, assignment['object'].id,
-                link_type_id='lt_assignment_to_person'
-            )
-            for link in person_links:
-                assignees.append({
-                    'id': link['object'].id,
-                    'name': link['object'].data.get('name')
-                })
-        
-        return assignees
+        rows = session.execute(_TASK_ASSIGNEES_STMT, {'task_id': task_id})
+        return [{'id': person_id, 'name': name} for person_id, name in rows]
     
     def _get_person_assignments_with_overlap(
         self,
@@ -766,45 +962,92 @@ class NudgeGenerator(SchedulerBase):
         # In production, would calculate actual daily allocations
         return {}
     
+    def _get_active_people(self, session: Session) -> List[PersonRow]:
+        """Get id, name and manager of active people."""
+        return list(map(PersonRow._make, session.execute(_ACTIVE_PEOPLE_STMT)))
+    
+    def _get_delay_risk_tasks(self, session: Session) -> List[ObjectModel]:
+        """Get active tasks at or above the delay risk threshold."""
+        return list(session.scalars(
+            _DELAY_RISK_TASKS_STMT, {'threshold': self.DELAY_RISK_THRESHOLD}
+        ).all())
+    
+    def _bulk_fetch_task_link_context(
+        self,
+        session: Session,
+        task_ids: List[str]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Set[str]]:
+        """
+        Get skill requirements and assignment state for many tasks in one query.
+        
+        Returns:
+            Tuple of (task ID -> skill requirement links in the same shape
+            as get_linked_objects, set of task IDs that have assignments)
+        """
+        skill_reqs_by_task: Dict[str, List[Dict[str, Any]]] = {}
+        assigned_task_ids: Set[str] = set()
+        if not task_ids:
+            return skill_reqs_by_task, assigned_task_ids
+        
+        rows = session.execute(_TASK_LINK_CONTEXT_STMT, {'task_ids': list(task_ids)})
+        for task_id, link_type_id, link_data, obj in rows:
+            if link_type_id == 'lt_task_assigned_to':
+                assigned_task_ids.add(task_id)
+            else:
+                skill_reqs_by_task.setdefault(task_id, []).append({
+                    'object': obj,
+                    'link_data': link_data or {}
+                })
+        
+        return skill_reqs_by_task, assigned_task_ids
+    
+    def _load_people_skills(
+        self,
+        session: Session
+    ) -> List[Tuple[PersonRow, Dict[str, int]]]:
+        """Get active people with their skill_id -> proficiency maps in two queries."""
+        people = self._get_active_people(session)
+        if not people:
+            return []
+        
+        skill_maps: Dict[str, Dict[str, int]] = {person.id: {} for person in people}
+        rows = session.execute(
+            _PEOPLE_SKILLS_STMT, {'person_ids': list(skill_maps)}
+        )
+        for person_id, link_data, skill_id in rows:
+            skill_maps[person_id][skill_id] = (link_data or {}).get('proficiency_level', 1)
+        
+        return [(person, skill_maps[person.id]) for person in people]
+    
     def _find_qualified_people(
         self,
         session: Session,
-        skill_reqs: List[Dict]
+        skill_reqs: List[Dict],
+        people_skills: Optional[List[Tuple[PersonRow, Dict[str, int]]]] = None
     ) -> List[Dict[str, Any]]:
-        """Find people qualified for given skill requirements."""
-        qualified = []
+        """
+        Find people qualified for given skill requirements.
         
-        # Get all active people
-        people = self.get_objects_by_type(session, 'ot_person', status='active')
+        Callers checking many requirement sets can pass people_skills from
+        _load_people_skills to avoid reloading people for each one.
+        """
+        if people_skills is None:
+            people_skills = self._load_people_skills(session)
         
-        for person in people:
-            # Get person's skills
-            person_skills = self.get_linked_objects(
-                session, person.id, link_type_id='lt_person_has_skill'
-            )
-            
-            person_skill_map = {
-                s['object'].data.get('skill_id'): s['link_data'].get('proficiency_level', 1)
-                for s in person_skills
-            }
-            
-            is_qualified = True
-            for req in skill_reqs:
-                req_skill_id = req['object'].data.get('skill_id')
-                req_level = req['object'].data.get('minimum_proficiency', 1)
-                
-                person_level = person_skill_map.get(req_skill_id, 0)
-                if person_level < req_level:
-                    is_qualified = False
-                    break
-            
-            if is_qualified:
-                qualified.append({
-                    'person_id': person.id,
-                    'person_name': person.data.get('name')
-                })
+        # Requirement data is the same for every person; read it once
+        reqs = [
+            (req['object'].data.get('skill_id'), req['object'].data.get('minimum_proficiency', 1))
+            for req in skill_reqs
+        ]
         
-        return qualified
+        return [
+            {
+                'person_id': person.id,
+                'person_name': person.name
+            }
+            for person, person_skill_map in people_skills
+            if all(person_skill_map.get(skill_id, 0) >= level for skill_id, level in reqs)
+        ]
     
     def _calculate_average_allocation(
         self,
@@ -813,14 +1056,30 @@ class NudgeGenerator(SchedulerBase):
         weeks: int
     ) -> float:
         """Calculate average allocation over past weeks."""
-        # Simplified - would calculate from actual assignment data
-        assignments = self._get_person_assignments(session, person_id)
+        return self._calculate_average_allocations(
+            session, [person_id], weeks
+        ).get(person_id, 0.0)
+    
+    def _calculate_average_allocations(
+        self,
+        session: Session,
+        person_ids: List[str],
+        weeks: int
+    ) -> Dict[str, float]:
+        """
+        Calculate average allocation over past weeks for several people.
         
-        if not assignments:
-            return 0.0
+        Simplified - averages allocation_percent across each person's
+        assignments in one grouped query. People without assignments are
+        left out; callers treat them as 0.
+        """
+        if not person_ids:
+            return {}
         
-        total = sum(a.data.get('allocation_percent', 0) for a in assignments)
-        return total / len(assignments) if assignments else 0.0
+        rows = session.execute(
+            _AVERAGE_ALLOCATIONS_STMT, {'person_ids': list(person_ids)}
+        )
+        return {person_id: float(average) for person_id, average in rows}
     
     def _calculate_current_allocation(
         self,
@@ -830,58 +1089,28 @@ class NudgeGenerator(SchedulerBase):
         """Calculate current allocation percentage."""
         return self._calculate_average_allocation(session, person_id, weeks=1)
     
+    def _calculate_current_allocations(
+        self,
+        session: Session,
+        person_ids: List[str]
+    ) -> Dict[str, float]:
+        """Calculate current allocation percentage for several people."""
+        return self._calculate_average_allocations(session, person_ids, weeks=1)
+    
     def _find_available_high_priority_tasks(
         self,
         session: Session
     ) -> List[ObjectModel]:
         """Find high-priority tasks that are unassigned."""
-        tasks = self.get_objects_by_type(session, 'ot_task', status='todo')
-        
-        available = []
-        for task in tasks:
-            priority_score = task.data.get('priority_score', 0)
-            if priority_score >= self.HIGH_PRIORITY_THRESHOLD:
-                # Check if unassigned
-                assignments = self.get_linked_objects(
-                    session, task.id, link_type_id='lt_task_assigned_to'
-                )
-                if not assignments:
-                    available.append(task)
-        
-        return available
-    
-    def _get_person_assignments(
-        self,
-        session: Session,
-        person_id: str
-    ) -> List[ObjectModel]:
-        """Get all assignments for a person."""
-        stmt = select(LinkModel).where(
-            and_(
-                LinkModel.type_id == 'lt_assignment_to_person',
-                LinkModel.target_id == person_id
-            )
-        )
-        links = session.scalars(stmt).all()
-        
-        assignments = []
-        for link in links:
-            assignment = self.get_object_by_id(session, link.source_id)
-            if assignment and assignment.status != 'deleted':
-                assignments.append(assignment)
-        
-        return assignments
+        return list(session.scalars(
+            _AVAILABLE_HIGH_PRIORITY_TASKS_STMT,
+            {'threshold': self.HIGH_PRIORITY_THRESHOLD}
+        ))
     
     def _count_by_type(self, nudges: List[NudgeCandidate]) -> Dict[str, int]:
         """Count nudges by type."""
-        counts = {}
-        for nudge in nudges:
-            counts[nudge.type.value] = counts.get(nudge.type.value, 0) + 1
-        return counts
+        return dict(Counter(nudge.type.value for nudge in nudges))
     
     def _count_by_severity(self, nudges: List[NudgeCandidate]) -> Dict[str, int]:
         """Count nudges by severity."""
-        counts = {}
-        for nudge in nudges:
-            counts[nudge.severity.value] = counts.get(nudge.severity.value, 0) + 1
-        return counts
+        return dict(Counter(nudge.severity.value for nudge in nudges))
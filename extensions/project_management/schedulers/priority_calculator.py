@@ -21,16 +21,48 @@ Usage:
 """
 
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 
-from sqlalchemy import select, and_
+import numpy as np
+from sqlalchemy import select, update, and_, func, bindparam
 
-from .base import SchedulerBase, ObjectModel, Session
+from .base import SchedulerBase, ObjectModel, LinkModel, Session
 
 logger = logging.getLogger(__name__)
 
+# Number of projects depending on each of :project_ids (zero counts omitted)
+_DEPENDENT_COUNTS_STMT = select(
+    LinkModel.target_id,
+    func.count()
+).where(
+    and_(
+        LinkModel.type_id == 'lt_project_depends_on',
+        LinkModel.target_id.in_(bindparam('project_ids', expanding=True))
+    )
+).group_by(LinkModel.target_id)
+
+# WEIGHTS keys in component-row column order; the last column is risk_penalty
+_COMPONENT_WEIGHT_KEYS = (
+    'customer_tier',
+    'deadline_proximity',
+    'business_value',
+    'contract_value',
+    'strategic_importance',
+    'dependency_boost',
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_deadline(value: str) -> datetime:
+    """Parse an ISO deadline string to a naive UTC datetime (cached by string)."""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
 
 @dataclass
 class PriorityComponents:
@@ -45,6 +77,16 @@ class PriorityComponents:
     total_score: float
 
 
+@dataclass
+class PriorityContext:
+    """Lookups shared by every project scored in one recalculation run."""
+    tier_map: Dict[str, str]
+    contract_min: Optional[float]
+    contract_max: Optional[float]
+    dependent_counts: Dict[str, int]
+    deadline_scores: Dict[str, float]
+
+
 class PriorityCalculator(SchedulerBase):
     """
     Calculates priority scores for projects.
@@ -128,19 +170,7 @@ class PriorityCalculator(SchedulerBase):
                 self.update_object_data(
                     session,
                     project_id,
-                    {
-                        'priority_score': round(components.total_score, 2),
-                        'priority_calculated_at': self.now().isoformat(),
-                        'priority_components': {
-                            'customer_tier_score': round(components.customer_tier_score, 2),
-                            'deadline_proximity_score': round(components.deadline_proximity_score, 2),
-                            'business_value_score': round(components.business_value_score, 2),
-                            'contract_value_score': round(components.contract_value_score, 2),
-                            'strategic_importance_score': round(components.strategic_importance_score, 2),
-                            'dependency_boost_score': round(components.dependency_boost_score, 2),
-                            'risk_penalty': round(components.risk_penalty, 2),
-                        }
-                    }
+                    self._priority_data(components, self.now())
                 )
                 session.commit()
                 self.logger.info(
@@ -174,41 +204,30 @@ class PriorityCalculator(SchedulerBase):
             else:
                 projects = self.get_objects_by_type(session, 'ot_project')
             
+            # Contract values are normalized against up to 1000 projects of
+            # any status, which is exactly the all_projects query above
+            if scope == "active_projects_only":
+                population = self.get_objects_by_type(session, 'ot_project')
+            else:
+                population = projects
+            ctx = self._build_priority_context(session, projects, population)
+            calculated_at = self.now()
+            updates = []
+            
             results = {
                 'processed': 0,
                 'updated': 0,
+                'unchanged': 0,
                 'errors': 0,
                 'scores': []
             }
             
+            scored = []
+            rows = []
             for project in projects:
                 try:
-                    components = self._calculate_components(session, project)
-                    
-                    self.update_object_data(
-                        session,
-                        project.id,
-                        {
-                            'priority_score': round(components.total_score, 2),
-                            'priority_calculated_at': self.now().isoformat(),
-                            'priority_components': {
-                                'customer_tier_score': round(components.customer_tier_score, 2),
-                                'deadline_proximity_score': round(components.deadline_proximity_score, 2),
-                                'business_value_score': round(components.business_value_score, 2),
-                                'contract_value_score': round(components.contract_value_score, 2),
-                                'strategic_importance_score': round(components.strategic_importance_score, 2),
-                                'dependency_boost_score': round(components.dependency_boost_score, 2),
-                                'risk_penalty': round(components.risk_penalty, 2),
-                            }
-                        }
-                    )
-                    
-                    results['updated'] += 1
-                    results['scores'].append({
-                        'project_id': project.id,
-                        'project_name': project.data.get('name', 'Unknown'),
-                        'score': components.total_score
-                    })
+                    rows.append(self._score_components(session, project, ctx))
+                    scored.append(project)
                     
                 except Exception as e:
                     self.logger.error(
@@ -217,11 +236,36 @@ class PriorityCalculator(SchedulerBase):
                     results['errors'] += 1
                 
                 results['processed'] += 1
-                
-                # Commit every 10 projects to avoid long transactions
-                if results['processed'] % 10 == 0:
-                    session.commit()
             
+            # Weighted totals for every scored project in one array pass
+            if rows:
+                for project, components in zip(
+                    scored, self._build_components(np.stack(rows)), strict=True
+                ):
+                    priority_data = self._priority_data(components, calculated_at)
+                    
+                    # The components capture every input, including time- and
+                    # population-dependent ones, so equal components mean
+                    # the stored priority is still current
+                    if self._priority_unchanged(project.data, priority_data):
+                        results['unchanged'] += 1
+                    else:
+                        updates.append({
+                            'id': project.id,
+                            'data': {**project.data, **priority_data},
+                            'version': project.version + 1
+                        })
+                        results['updated'] += 1
+                    
+                    results['scores'].append({
+                        'project_id': project.id,
+                        'project_name': project.data.get('name', 'Unknown'),
+                        'score': components.total_score
+                    })
+            
+            # One executemany UPDATE by primary key for the whole batch
+            if updates:
+                session.execute(update(ObjectModel), updates)
             session.commit()
             
             # Calculate statistics
@@ -235,11 +279,43 @@ class PriorityCalculator(SchedulerBase):
             
             self.logger.info(
                 f"Priority recalculation complete: "
-                f"{results['updated']} updated, {results['errors']} errors"
+                f"{results['updated']} updated, {results['unchanged']} unchanged, "
+                f"{results['errors']} errors"
             )
             
             return results
     
+    def _priority_data(
+        self,
+        components: PriorityComponents,
+        calculated_at: datetime
+    ) -> Dict[str, Any]:
+        """Project data fields that store a calculated priority."""
+        return {
+            'priority_score': round(components.total_score, 2),
+            'priority_calculated_at': calculated_at.isoformat(),
+            'priority_components': {
+                'customer_tier_score': round(components.customer_tier_score, 2),
+                'deadline_proximity_score': round(components.deadline_proximity_score, 2),
+                'business_value_score': round(components.business_value_score, 2),
+                'contract_value_score': round(components.contract_value_score, 2),
+                'strategic_importance_score': round(components.strategic_importance_score, 2),
+                'dependency_boost_score': round(components.dependency_boost_score, 2),
+                'risk_penalty': round(components.risk_penalty, 2),
+            }
+        }
+    
+    def _priority_unchanged(
+        self,
+        project_data: Dict[str, Any],
+        priority_data: Dict[str, Any]
+    ) -> bool:
+        """Whether a project already stores this score and component breakdown."""
+        return (
+            project_data.get('priority_score') == priority_data['priority_score'] and
+            project_data.get('priority_components') == priority_data['priority_components']
+        )
+    
     def get_priority_components(
         self,
         project_id: str
@@ -260,10 +336,53 @@ class PriorityCalculator(SchedulerBase):
                 
             return self._calculate_components(session, project)
     
+    def _build_priority_context(
+        self,
+        session: Session,
+        projects: List[ObjectModel],
+        population: List[ObjectModel]
+    ) -> PriorityContext:
+        """
+        Load the lookups needed to score a batch of projects.
+        
+        Args:
+            session: Database session
+            projects: Projects that will be scored
+            population: Projects whose contract values set the normalization range
+            
+        Returns:
+            PriorityContext with customer tiers, the contract value range,
+            dependent counts and deadline proximity scores
+        """
+        customers = self.get_objects_by_ids(
+            session, (p.data.get('customer_id') for p in projects)
+        )
+        contract_min, contract_max = self._contract_value_range(population)
+        
+        days = np.fromiter(
+            (self._days_until_deadline(p.data.get('planned_end')) for p in projects),
+            dtype=np.float64
+        )
+        deadline_scores = self._deadline_proximity_scores(days)
+        
+        return PriorityContext(
+            tier_map={
+                customer_id: customer.data.get('tier', 'tier_2')
+                for customer_id, customer in customers.items()
+            },
+            contract_min=contract_min,
+            contract_max=contract_max,
+            dependent_counts=self._load_dependent_counts(
+                session, [p.id for p in projects]
+            ),
+            deadline_scores=dict(zip((p.id for p in projects), deadline_scores.tolist(), strict=True))
+        )
+    
     def _calculate_components(
         self,
         session: Session,
-        project: ObjectModel
+        project: ObjectModel,
+        ctx: Optional[PriorityContext] = None
     ) -> PriorityComponents:
         """
         Calculate all priority score components for a project.
@@ -271,75 +390,111 @@ class PriorityCalculator(SchedulerBase):
         Args:
             session: Database session
             project: Project object
+            ctx: Batch lookups; when omitted they are loaded for this project
             
         Returns:
             PriorityComponents with all scores
         """
+        row = self._score_components(session, project, ctx)
+        return self._build_components(row[np.newaxis])[0]
+    
+    def _score_components(
+        self,
+        session: Session,
+        project: ObjectModel,
+        ctx: Optional[PriorityContext] = None
+    ) -> np.ndarray:
+        """
+        Score the weighted components and risk penalty of a project.
+        
+        Args:
+            session: Database session
+            project: Project object
+            ctx: Batch lookups; when omitted they are loaded for this project
+            
+        Returns:
+            Float row in _COMPONENT_WEIGHT_KEYS order followed by risk_penalty
+        """
         data = project.data
         
         # 1. Customer Tier Score (25%)
-        customer_tier_score = self._calculate_customer_tier_score(session, data)
+        customer_tier_score = self._calculate_customer_tier_score(session, data, ctx)
         
         # 2. Deadline Proximity Score (25%)
-        deadline_proximity_score = self._calculate_deadline_proximity_score(data)
+        if ctx is not None:
+            deadline_proximity_score = ctx.deadline_scores[project.id]
+        else:
+            deadline_proximity_score = self._calculate_deadline_proximity_score(data)
         
         # 3. Business Value Score (20%)
         business_value_score = data.get('business_value_score', 50)
         
         # 4. Contract Value Score (15%)
-        contract_value_score = self._calculate_contract_value_score(session, data)
+        contract_value_score = self._calculate_contract_value_score(session, data, ctx)
         
         # 5. Strategic Importance Score (10%)
         strategic_importance_score = data.get('strategic_importance', 50)
         
         # 6. Dependency Boost Score (5%)
         dependency_boost_score = self._calculate_dependency_boost_score(
-            session, project.id
+            session, project.id, ctx
         )
         
         # 7. Risk Penalty
         risk_penalty = self._calculate_risk_penalty(data)
         
-        # Calculate total weighted score
-        total_score = (
-            self.WEIGHTS['customer_tier'] * customer_tier_score +
-            self.WEIGHTS['deadline_proximity'] * deadline_proximity_score +
-            self.WEIGHTS['business_value'] * business_value_score +
-            self.WEIGHTS['contract_value'] * contract_value_score +
-            self.WEIGHTS['strategic_importance'] * strategic_importance_score +
-            self.WEIGHTS['dependency_boost'] * dependency_boost_score -
-            risk_penalty
-        )
+        return np.array([
+            customer_tier_score,
+            deadline_proximity_score,
+            business_value_score,
+            contract_value_score,
+            strategic_importance_score,
+            dependency_boost_score,
+            risk_penalty,
+        ], dtype=np.float64)
+    
+    def _build_components(self, rows: np.ndarray) -> List[PriorityComponents]:
+        """
+        Combine component rows into PriorityComponents with weighted totals.
         
-        # Clamp to 0-100 range
-        total_score = max(0.0, min(100.0, total_score))
+        Totals are accumulated column by column in formula order, so they
+        match the scalar weighted sum exactly, then clamped to 0-100.
+        """
+        totals = np.zeros(len(rows))
+        for column, key in enumerate(_COMPONENT_WEIGHT_KEYS):
+            totals += self.WEIGHTS[key] * rows[:, column]
+        totals -= rows[:, -1]
+        np.clip(totals, 0.0, 100.0, out=totals)
         
-        return PriorityComponents(
-            customer_tier_score=round(customer_tier_score, 2),
-            deadline_proximity_score=round(deadline_proximity_score, 2),
-            business_value_score=round(business_value_score, 2),
-            contract_value_score=round(contract_value_score, 2),
-            strategic_importance_score=round(strategic_importance_score, 2),
-            dependency_boost_score=round(dependency_boost_score, 2),
-            risk_penalty=round(risk_penalty, 2),
-            total_score=round(total_score, 2)
-        )
+        return [
+            PriorityComponents(
+                *(round(value, 2) for value in row),
+                total_score=round(total, 2)
+            )
+            for row, total in zip(rows.tolist(), totals.tolist(), strict=True)
+        ]
     
     def _calculate_customer_tier_score(
         self,
         session: Session,
-        project_data: Dict[str, Any]
+        project_data: Dict[str, Any],
+        ctx: Optional[PriorityContext] = None
     ) -> float:
         """Calculate score based on customer tier."""
         customer_id = project_data.get('customer_id')
         if not customer_id:
             return 50.0  # Default middle score
+        
+        if ctx is not None:
+            tier = ctx.tier_map.get(customer_id)
+            if tier is None:
+                return 50.0
+        else:
+            customer = self.get_object_by_id(session, customer_id)
+            if not customer:
+                return 50.0
+            tier = customer.data.get('tier', 'tier_2')
             
-        customer = self.get_object_by_id(session, customer_id)
-        if not customer:
-            return 50.0
-            
-        tier = customer.data.get('tier', 'tier_2')
         return float(self.CUSTOMER_TIER_WEIGHTS.get(tier, 75))
     
     def _calculate_deadline_proximity_score(
@@ -351,38 +506,54 @@ class PriorityCalculator(SchedulerBase):
         
         Closer deadlines get higher priority scores.
         """
-        planned_end = project_data.get('planned_end')
+        days = self._days_until_deadline(project_data.get('planned_end'))
+        return float(self._deadline_proximity_scores(np.array([days]))[0])
+    
+    def _days_until_deadline(self, planned_end: Any) -> float:
+        """Days until a planned_end value, or NaN if it is missing or unparseable."""
         if not planned_end:
-            return 50.0  # Default if no deadline
+            return np.nan
             
-        # Parse date if string
+        # Parse date if string; now() is naive UTC, so deadlines are too
         if isinstance(planned_end, str):
             try:
-                planned_end = datetime.fromisoformat(planned_end.replace('Z', '+00:00'))
+                planned_end = _parse_deadline(planned_end)
             except ValueError:
-                return 50.0
+                return np.nan
+        elif planned_end.tzinfo is not None:
+            planned_end = planned_end.astimezone(timezone.utc).replace(tzinfo=None)
         
-        days_until = self.days_until(planned_end)
+        return self.days_until(planned_end)
+    
+    def _deadline_proximity_scores(self, days: np.ndarray) -> np.ndarray:
+        """
+        Score days-until-deadline values on the piecewise linear curve.
         
-        if days_until <= self.DEADLINE_URGENT_DAYS:
-            return 100.0  # Critical urgency
-        elif days_until <= self.DEADLINE_WARNING_DAYS:
-            # Linear interpolation from 100 to 70
-            progress = (days_until - self.DEADLINE_URGENT_DAYS) / \
-                      (self.DEADLINE_WARNING_DAYS - self.DEADLINE_URGENT_DAYS)
-            return 100.0 - (progress * 30.0)
-        elif days_until <= self.DEADLINE_PLANNING_DAYS:
-            # Linear interpolation from 70 to 40
-            progress = (days_until - self.DEADLINE_WARNING_DAYS) / \
-                      (self.DEADLINE_PLANNING_DAYS - self.DEADLINE_WARNING_DAYS)
-            return 70.0 - (progress * 30.0)
-        else:
-            return 40.0  # Far future, lower priority
+        100 up to DEADLINE_URGENT_DAYS, falling to 70 at DEADLINE_WARNING_DAYS
+        and 40 at DEADLINE_PLANNING_DAYS, then flat at 40. NaN (no usable
+        deadline) scores 50.
+        """
+        urgent = self.DEADLINE_URGENT_DAYS
+        warning = self.DEADLINE_WARNING_DAYS
+        planning = self.DEADLINE_PLANNING_DAYS
+        
+        scores = np.select(
+            [days <= urgent, days <= warning, days <= planning],
+            [
+                100.0,
+                100.0 - ((days - urgent) / (warning - urgent)) * 30.0,
+                70.0 - ((days - warning) / (planning - warning)) * 30.0,
+            ],
+            default=40.0
+        )
+        scores[np.isnan(days)] = 50.0
+        return scores
     
     def _calculate_contract_value_score(
         self,
         session: Session,
-        project_data: Dict[str, Any]
+        project_data: Dict[str, Any],
+        ctx: Optional[PriorityContext] = None
     ) -> float:
         """
         Calculate score based on contract value relative to other projects.
@@ -390,29 +561,38 @@ class PriorityCalculator(SchedulerBase):
         contract_value = project_data.get('contract_value') or project_data.get('budget_amount', 0)
         if not contract_value:
             return 50.0
+        
+        if ctx is not None:
+            min_val, max_val = ctx.contract_min, ctx.contract_max
+        else:
+            min_val, max_val = self._contract_value_range(
+                self.get_objects_by_type(session, 'ot_project', limit=1000)
+            )
             
-        # Get all project contract values for normalization
-        # This is a simplified approach - in production, cache these values
-        with self.get_session() as s:
-            projects = self.get_objects_by_type(s, 'ot_project', limit=1000)
-            values = [
-                p.data.get('contract_value') or p.data.get('budget_amount', 0)
-                for p in projects
-                if (p.data.get('contract_value') or p.data.get('budget_amount', 0)) > 0
-            ]
-            
-            if not values:
-                return 50.0
-                
-            min_val = min(values)
-            max_val = max(values)
+        if min_val is None:
+            return 50.0
             
-            return self.normalize_score(contract_value, min_val, max_val)
+        return self.normalize_score(contract_value, min_val, max_val)
+    
+    def _contract_value_range(
+        self,
+        projects: Iterable[ObjectModel]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Min and max positive contract value, or (None, None) if there are none."""
+        values = np.fromiter(
+            (p.data.get('contract_value') or p.data.get('budget_amount', 0) for p in projects),
+            dtype=np.float64
+        )
+        values = values[values > 0]
+        if not values.size:
+            return None, None
+        return float(values.min()), float(values.max())
     
     def _calculate_dependency_boost_score(
         self,
         session: Session,
-        project_id: str
+        project_id: str,
+        ctx: Optional[PriorityContext] = None
     ) -> float:
         """
         Calculate boost for projects that other projects depend on.
@@ -420,17 +600,26 @@ class PriorityCalculator(SchedulerBase):
         Projects with more dependents get a small boost.
         """
         # Count projects that depend on this project
-        stmt = select(LinkModel).where(
-            and_(
-                LinkModel.type_id == 'lt_project_depends_on',
-                LinkModel.target_id == project_id
-            )
-        )
-        dependent_count = len(session.scalars(stmt).all())
+        if ctx is not None:
+            dependent_counts = ctx.dependent_counts
+        else:
+            dependent_counts = self._load_dependent_counts(session, [project_id])
+        dependent_count = dependent_counts.get(project_id, 0)
         
         # Boost of 20 points per dependent, max 100
         return min(100.0, dependent_count * 20.0)
     
+    def _load_dependent_counts(
+        self,
+        session: Session,
+        project_ids: List[str]
+    ) -> Dict[str, int]:
+        """Count dependent projects per project ID in one grouped query."""
+        if not project_ids:
+            return {}
+        rows = session.execute(_DEPENDENT_COUNTS_STMT, {'project_ids': project_ids})
+        return dict(rows.all())
+    
     def _calculate_risk_penalty(self, project_data: Dict[str, Any]) -> float:
         """
         Calculate risk penalty based on risk score.
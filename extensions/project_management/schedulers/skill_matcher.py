@@ -26,17 +26,99 @@ Usage:
     gaps = await matcher.identify_skill_gaps()
 """
 
+import copy
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select, and_, or_
+import numpy as np
+from sqlalchemy import select, and_, or_, func, bindparam
+from sqlalchemy.orm import aliased
 
-from .base import SchedulerBase, ObjectModel, Session
+from .base import SchedulerBase, ObjectModel, LinkModel, Session
 
 logger = logging.getLogger(__name__)
 
+# (person_id, link data, skill_id) for the skills held by :person_ids
+_PERSON_SKILLS_STMT = select(
+    LinkModel.source_id,
+    LinkModel.data,
+    ObjectModel.data['skill_id'].as_string()
+).join(
+    ObjectModel, LinkModel.target_id == ObjectModel.id
+).where(
+    and_(
+        LinkModel.type_id == 'lt_person_has_skill',
+        LinkModel.source_id.in_(bindparam('person_ids', expanding=True)),
+        ObjectModel.status != 'deleted'
+    )
+)
+
+# The same rows restricted to :skill_ids
+_PERSON_SKILLS_FOR_SKILLS_STMT = _PERSON_SKILLS_STMT.where(
+    ObjectModel.data['skill_id'].as_string().in_(bindparam('skill_ids', expanding=True))
+)
+
+_assignment_person_id = ObjectModel.data['person_id'].as_string()
+_assignment_allocation = func.coalesce(
+    func.sum(func.coalesce(ObjectModel.data['allocation_percent'].as_float(), 0)), 0
+)
+
+# Total allocation percent of :person_id's active assignments
+_ALLOCATION_STMT = select(_assignment_allocation).where(
+    and_(
+        ObjectModel.type_id == 'ot_assignment',
+        _assignment_person_id == bindparam('person_id'),
+        ObjectModel.status == 'active'
+    )
+)
+
+# (person_id, total allocation percent) for :person_ids with active assignments
+_ALLOCATIONS_STMT = select(_assignment_person_id, _assignment_allocation).where(
+    and_(
+        ObjectModel.type_id == 'ot_assignment',
+        _assignment_person_id.in_(bindparam('person_ids', expanding=True)),
+        ObjectModel.status == 'active'
+    )
+).group_by(_assignment_person_id)
+
+_person_skill = aliased(ObjectModel)
+_skilled_person = aliased(ObjectModel)
+
+# Number of :skill_id person-skill records at :min_proficiency or above
+# whose person is active
+_person_skill_id = _person_skill.data['skill_id'].as_string()
+_person_skill_level = func.coalesce(_person_skill.data['proficiency_level'].as_float(), 0)
+
+_QUALIFIED_PEOPLE_COUNT_STMT = select(func.count()).select_from(_person_skill).join(
+    _skilled_person, _skilled_person.id == _person_skill.data['person_id'].as_string()
+).where(
+    and_(
+        _person_skill.type_id == 'ot_person_skill',
+        _person_skill_id == bindparam('skill_id'),
+        _person_skill_level >= bindparam('min_proficiency'),
+        _person_skill.status != 'deleted',
+        _skilled_person.data['status'].as_string() == 'active'
+    )
+)
+
+# (skill_id, proficiency, count) of active people's records for :skill_ids
+_QUALIFIED_PEOPLE_LEVELS_STMT = select(
+    _person_skill_id, _person_skill_level, func.count()
+).select_from(_person_skill).join(
+    _skilled_person, _skilled_person.id == _person_skill.data['person_id'].as_string()
+).where(
+    and_(
+        _person_skill.type_id == 'ot_person_skill',
+        _person_skill_id.in_(bindparam('skill_ids', expanding=True)),
+        _person_skill.status != 'deleted',
+        _skilled_person.data['status'].as_string() == 'active'
+    )
+).group_by(_person_skill_id, _person_skill_level)
+
 
 @dataclass
 class SkillMatchResult:
@@ -90,9 +172,13 @@ class SkillMatcher(SchedulerBase):
     GOOD_MATCH = 70
     ACCEPTABLE_MATCH = 50
     
+    # Seconds a matcher reuses its identify_skill_gaps results
+    SKILL_GAPS_TTL = 60
+    
     def __init__(self, db_adapter=None, neo4j_adapter=None):
         super().__init__(db_adapter, neo4j_adapter)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._gap_cache: Optional[Tuple[float, List[SkillGap]]] = None
     
     async def run(self) -> Dict[str, Any]:
         """
@@ -148,27 +234,44 @@ class SkillMatcher(SchedulerBase):
                 # No specific requirements - return available people
                 return self._get_available_people(session, limit)
             
-            # Get all active people
+            # Get all active people and, in one query, their required skills
             people = self.get_objects_by_type(session, 'ot_person', status='active')
+            person_skills = self._bulk_get_person_skills(
+                session,
+                [person.id for person in people],
+                [req['skill_id'] for req in skill_requirements]
+            )
             
-            matches = []
-            for person in people:
-                match_result = self._calculate_match(
-                    session, person, skill_requirements, task
-                )
-                
-                if match_result.match_score >= min_score:
-                    matches.append(match_result)
+            scores = self._score_matches(
+                [person.id for person in people], person_skills, skill_requirements
+            )
             
-            # Sort by match score (descending)
-            matches.sort(key=lambda x: x.match_score, reverse=True)
+            # Keep the rounded score so ties rank exactly as in the results
+            candidates = [
+                (round(score, 2), score, person)
+                for person, score in zip(people, scores.tolist(), strict=True)
+                if round(score, 2) >= min_score
+            ]
             
             self.logger.info(
-                f"Found {len(matches)} matches for task {task_id}, "
+                f"Found {len(candidates)} matches for task {task_id}, "
                 f"returning top {limit}"
             )
             
-            return matches[:limit]
+            # Best match scores first, without sorting the whole candidate
+            # list; detailed results are only built for the ones returned
+            top = heapq.nlargest(limit, candidates, key=lambda x: x[0])
+            availability = self._bulk_availability(
+                session, [person.id for _, _, person in top]
+            )
+            
+            return [
+                self._calculate_match(
+                    person, person_skills.get(person.id, {}),
+                    skill_requirements, task, score, availability[person.id]
+                )
+                for _, score, person in top
+            ]
     
     async def calculate_skill_match(
         self,
@@ -212,7 +315,13 @@ class SkillMatcher(SchedulerBase):
                     recommendation="No specific skill requirements for this task"
                 )
             
-            return self._calculate_match(session, person, skill_requirements, task)
+            person_skills = self._bulk_get_person_skills(session, [person_id])
+            score = self._score_matches([person_id], person_skills, skill_requirements)[0]
+            return self._calculate_match(
+                person, person_skills.get(person_id, {}),
+                skill_requirements, task, float(score),
+                self._calculate_availability(session, person_id)
+            )
     
     async def identify_skill_gaps(self) -> List[SkillGap]:
         """
@@ -221,9 +330,17 @@ class SkillMatcher(SchedulerBase):
         Analyzes all tasks with skill requirements and compares against
         available talent pool.
         
+        Results are reused by this matcher for SKILL_GAPS_TTL seconds, so
+        run() and suggest_training() share one analysis; callers get copies.
+        
         Returns:
             List of SkillGap objects, sorted by severity
         """
+        if self._gap_cache is not None:
+            cached_at, cached_gaps = self._gap_cache
+            if time.monotonic() - cached_at < self.SKILL_GAPS_TTL:
+                return copy.deepcopy(cached_gaps)
+        
         self.logger.info("Identifying organization-wide skill gaps")
         
         with self.get_session() as session:
@@ -248,16 +365,21 @@ class SkillMatcher(SchedulerBase):
                     min_proficiency
                 )
             
-            # Count qualified people for each skill
+            # Count qualified people for every skill at once
+            skills = self.get_objects_by_ids(session, skill_stats)
+            qualified_counts = self._count_qualified_people_by_skill(session, {
+                skill_id: stats['max_required_level']
+                for skill_id, stats in skill_stats.items()
+                if skill_id in skills
+            })
+            
             gaps = []
             for skill_id, stats in skill_stats.items():
-                skill = self.get_object_by_id(session, skill_id)
+                skill = skills.get(skill_id)
                 if not skill:
                     continue
                 
-                qualified_count = self._count_qualified_people(
-                    session, skill_id, stats['max_required_level']
-                )
+                qualified_count = qualified_counts.get(skill_id, 0)
                 
                 # Calculate gap severity
                 tasks_count = len(stats['tasks'])
@@ -287,7 +409,8 @@ class SkillMatcher(SchedulerBase):
             gaps.sort(key=lambda x: severity_order.get(x.gap_severity, 4))
             
             self.logger.info(f"Found {len(gaps)} skill gaps")
-            return gaps
+            self._gap_cache = (time.monotonic(), gaps)
+            return copy.deepcopy(gaps)
     
     async def suggest_training(
         self,
@@ -409,42 +532,126 @@ class SkillMatcher(SchedulerBase):
         
         return requirements
     
-    def _calculate_match(
+    def _bulk_get_person_skills(
         self,
         session: Session,
-        person: ObjectModel,
-        skill_requirements: List[Dict[str, Any]],
-        task: ObjectModel
-    ) -> SkillMatchResult:
-        """Calculate skill match for a person against requirements."""
+        person_ids: List[str],
+        skill_ids: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get skill maps for several people in one query.
         
-        # Get person's skills
-        person_skills = self.get_linked_objects(
-            session, person.id, link_type_id='lt_person_has_skill'
-        )
+        Args:
+            session: Database session
+            person_ids: People to load skills for
+            skill_ids: Optional filter; only these skills are loaded
+            
+        Returns:
+            Dictionary of person ID to {skill_id: {'proficiency', 'years'}}.
+            People without (matching) skills are omitted.
+        """
+        if not person_ids:
+            return {}
+        
+        if skill_ids is None:
+            rows = session.execute(_PERSON_SKILLS_STMT, {'person_ids': list(person_ids)})
+        else:
+            rows = session.execute(_PERSON_SKILLS_FOR_SKILLS_STMT, {
+                'person_ids': list(person_ids),
+                'skill_ids': list(skill_ids)
+            })
         
-        person_skill_map = {}
-        for ps in person_skills:
-            skill_id = ps['object'].data.get('skill_id')
-            proficiency = ps['link_data'].get('proficiency_level', 1)
-            years = ps['link_data'].get('years_experience', 0)
-            person_skill_map[skill_id] = {
-                'proficiency': proficiency,
-                'years': years
+        person_skills: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for person_id, link_data, skill_id in rows:
+            link_data = link_data or {}
+            person_skills.setdefault(person_id, {})[skill_id] = {
+                'proficiency': link_data.get('proficiency_level', 1),
+                'years': link_data.get('years_experience', 0)
             }
         
+        return person_skills
+    
+    def _score_matches(
+        self,
+        person_ids: List[str],
+        person_skills: Dict[str, Dict[str, Dict[str, Any]]],
+        skill_requirements: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Calculate unrounded match scores (0-100) for several people at once.
+        
+        Builds a people x requirements proficiency matrix and applies the
+        module-level formula to all pairs together.
+        
+        Args:
+            person_ids: People to score, in output order
+            person_skills: Skill maps from _bulk_get_person_skills
+            skill_requirements: Requirements from _get_task_skill_requirements
+            
+        Returns:
+            Array of match scores aligned with person_ids
+        """
+        skill_columns: Dict[str, List[int]] = {}
+        for j, req in enumerate(skill_requirements):
+            skill_columns.setdefault(req['skill_id'], []).append(j)
+        
+        # (row, column, level) for every held required skill, scattered into
+        # the matrices with one indexed assignment
+        cells = [
+            (i, j, person_skill['proficiency'])
+            for i, person_id in enumerate(person_ids)
+            for skill_id, person_skill in person_skills.get(person_id, {}).items()
+            for j in skill_columns.get(skill_id, ())
+        ]
+        
+        levels = np.zeros((len(person_ids), len(skill_requirements)))
+        held = np.zeros(levels.shape, dtype=bool)
+        if cells:
+            rows, columns, cell_levels = zip(*cells, strict=True)
+            levels[rows, columns] = cell_levels
+            held[rows, columns] = True
+        
+        required = np.array([req['min_proficiency'] for req in skill_requirements], dtype=float)
+        weights = [req['weight'] for req in skill_requirements]
+        
+        full = held & (levels >= required)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skill_scores = np.where(full, 1.0, np.where(held, (levels / required) * 0.5, 0.0))
+        
+        # Accumulate column by column so sums match the per-requirement formula exactly
+        weighted_score = np.zeros(len(person_ids))
+        for j, weight in enumerate(weights):
+            weighted_score += skill_scores[:, j] * weight
+        
+        total_weight = sum(weights)
+        if total_weight > 0:
+            return (weighted_score / total_weight) * 100
+        return np.full(len(person_ids), 100.0)
+    
+    def _calculate_match(
+        self,
+        person: ObjectModel,
+        person_skill_map: Dict[str, Dict[str, Any]],
+        skill_requirements: List[Dict[str, Any]],
+        task: ObjectModel,
+        match_score: float,
+        availability: float
+    ) -> SkillMatchResult:
+        """
+        Build the detailed skill match for a person against requirements.
+        
+        person_skill_map comes from _bulk_get_person_skills, match_score
+        from _score_matches and availability from _bulk_availability or
+        _calculate_availability.
+        """
         matching = []
         missing = []
         below = []
         development = []
         
-        total_weight = 0.0
-        weighted_score = 0.0
-        
         for req in skill_requirements:
             skill_id = req['skill_id']
             required_level = req['min_proficiency']
-            weight = req['weight']
             
             person_skill = person_skill_map.get(skill_id)
             
@@ -460,10 +667,8 @@ class SkillMatcher(SchedulerBase):
                         'person_level': person_level,
                         'years_experience': person_skill['years']
                     })
-                    skill_score = 1.0
                 else:
                     # Below required but has skill
-                    skill_score = (person_level / required_level) * 0.5
                     below.append({
                         'skill_id': skill_id,
                         'skill_name': req['skill_name'],
@@ -485,19 +690,6 @@ class SkillMatcher(SchedulerBase):
                     'required_level': required_level,
                     'mandatory': req['is_mandatory']
                 })
-                skill_score = 0.0
-            
-            total_weight += weight
-            weighted_score += skill_score * weight
-        
-        # Calculate final match score
-        if total_weight > 0:
-            match_score = (weighted_score / total_weight) * 100
-        else:
-            match_score = 100.0
-        
-        # Check availability
-        availability = self._calculate_availability(session, person.id)
         
         # Determine recommendation
         if match_score >= self.EXCELLENT_MATCH:
@@ -533,9 +725,11 @@ class SkillMatcher(SchedulerBase):
         """Get available people when no specific skill requirements."""
         people = self.get_objects_by_type(session, 'ot_person', status='active')
         
+        people = people[:limit]
+        availability = self._bulk_availability(session, [person.id for person in people])
+        
         results = []
-        for person in people[:limit]:
-            availability = self._calculate_availability(session, person.id)
+        for person in people:
             results.append(SkillMatchResult(
                 person_id=person.id,
                 person_name=person.data.get('name', 'Unknown'),
@@ -545,7 +739,7 @@ class SkillMatcher(SchedulerBase):
                 missing_skills=[],
                 below_required=[],
                 development_opportunities=[],
-                availability_percent=availability,
+                availability_percent=availability[person.id],
                 recommendation="Available resource"
             ))
         
@@ -583,26 +777,39 @@ class SkillMatcher(SchedulerBase):
         min_proficiency: int
     ) -> int:
         """Count people qualified for a skill at given proficiency."""
-        # Get all person-skill links for this skill
-        stmt = select(ObjectModel).where(
-            and_(
-                ObjectModel.type_id == 'ot_person_skill',
-                ObjectModel.data['skill_id'].astext == skill_id,
-                ObjectModel.status != 'deleted'
-            )
-        )
-        person_skills = session.scalars(stmt).all()
+        return session.scalar(_QUALIFIED_PEOPLE_COUNT_STMT, {
+            'skill_id': skill_id,
+            'min_proficiency': min_proficiency
+        })
+    
+    def _count_qualified_people_by_skill(
+        self,
+        session: Session,
+        min_proficiency_by_skill: Dict[str, int]
+    ) -> Dict[str, int]:
+        """
+        Count qualified people for several skills in one query.
         
-        count = 0
-        for ps in person_skills:
-            if ps.data.get('proficiency_level', 0) >= min_proficiency:
-                # Check if person is active
-                person_id = ps.data.get('person_id')
-                person = self.get_object_by_id(session, person_id)
-                if person and person.data.get('status') == 'active':
-                    count += 1
+        Args:
+            session: Database session
+            min_proficiency_by_skill: Skill ID to the proficiency required
+            
+        Returns:
+            Dictionary of skill ID to qualified people count
+        """
+        if not min_proficiency_by_skill:
+            return {}
+        
+        rows = session.execute(_QUALIFIED_PEOPLE_LEVELS_STMT, {
+            'skill_ids': list(min_proficiency_by_skill)
+        })
         
-        return count
+        counts = dict.fromkeys(min_proficiency_by_skill, 0)
+        for skill_id, proficiency, count in rows:
+            if proficiency >= min_proficiency_by_skill[skill_id]:
+                counts[skill_id] += count
+        
+        return counts
     
     def _calculate_availability(
         self,
@@ -610,23 +817,35 @@ class SkillMatcher(SchedulerBase):
         person_id: str
     ) -> float:
         """Calculate current availability percentage for a person."""
-        # Get current assignments
-        stmt = select(ObjectModel).where(
-            and_(
-                ObjectModel.type_id == 'ot_assignment',
-                ObjectModel.data['person_id'].astext == person_id,
-                ObjectModel.status == 'active'
-            )
-        )
-        assignments = session.scalars(stmt).all()
-        
-        total_allocation = sum(
-            a.data.get('allocation_percent', 0)
-            for a in assignments
-        )
+        total_allocation = session.scalar(_ALLOCATION_STMT, {'person_id': person_id})
         
         return max(0.0, 100.0 - total_allocation)
     
+    def _bulk_availability(
+        self,
+        session: Session,
+        person_ids: List[str]
+    ) -> Dict[str, float]:
+        """
+        Calculate availability percentages for several people in one query.
+        
+        Args:
+            session: Database session
+            person_ids: People to calculate availability for
+            
+        Returns:
+            Dictionary of person ID to availability percentage
+        """
+        availability = dict.fromkeys(person_ids, 100.0)
+        if not person_ids:
+            return availability
+        
+        rows = session.execute(_ALLOCATIONS_STMT, {'person_ids': list(person_ids)})
+        for person_id, total_allocation in rows:
+            availability[person_id] = max(0.0, 100.0 - total_allocation)
+        
+        return availability
+    
     def _find_related_skills(
         self,
         session: Session,
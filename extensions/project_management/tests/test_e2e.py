@@ -28,8 +28,9 @@ from extensions.project_management.schedulers import (
     ConflictDetector
 )
 from extensions.project_management.schedulers.nudge_generator import (
-    NudgeCandidate, NudgeType, NudgeSeverity
+    NudgeCandidate, NudgeType, NudgeSeverity, PersonRow
 )
+from extensions.project_management.schedulers.conflict_detector import SprintTaskRow
 
 
 # =============================================================================
@@ -308,10 +309,7 @@ class TestSprintPlanningWorkflow:
         ))
         detector.get_objects_by_type = MagicMock(return_value=[sprint])
         detector._get_sprint_tasks = MagicMock(return_value=[
-            create_object(f'st_{t.id}', 'ot_sprint_task', {
-                'sprint_id': 'sprint_10',
-                'task_id': t.id
-            })
+            SprintTaskRow(id=t.task_id, estimated_hours=None)
             for t in recommendation.recommended_tasks[:5]
         ])
         detector._get_sprint_participants = MagicMock(return_value=team)
@@ -399,9 +397,9 @@ class TestScopeChangeWorkflow:
             __exit__=MagicMock()
         ))
         analyzer.get_object_by_id = MagicMock(return_value=project)
-        analyzer.get_linked_objects = MagicMock(return_value=[
-            {'object': task, 'link_data': {}} for task in existing_tasks
-        ])
+        analyzer._sum_linked_field = MagicMock(return_value=sum(
+            task.data['estimated_hours'] for task in existing_tasks
+        ))
         
         impact = await analyzer.analyze_scope_change_impact(
             project_id='proj_alpha',
@@ -573,25 +571,17 @@ class TestSkillMatchingWorkflow:
         matcher.get_linked_objects = MagicMock(side_effect=lambda s, id, **kwargs: {
             ('task_ml', 'lt_task_requires_skill'): [
                 {'object': sr, 'link_data': {}} for sr in skill_reqs
-            ],
-            ('person_alice', 'lt_person_has_skill'): [
-                {'object': create_object(f'ps_alice_{p["skill_id"]}', 'ot_person_skill', p),
-                 'link_data': {'proficiency_level': p['proficiency']}}
-                for p in person_skills['person_alice']
-            ],
-            ('person_bob', 'lt_person_has_skill'): [
-                {'object': create_object(f'ps_bob_{p["skill_id"]}', 'ot_person_skill', p),
-                 'link_data': {'proficiency_level': p['proficiency']}}
-                for p in person_skills['person_bob']
-            ],
-            ('person_carol', 'lt_person_has_skill'): [
-                {'object': create_object(f'ps_carol_{p["skill_id"]}', 'ot_person_skill', p),
-                 'link_data': {'proficiency_level': p['proficiency']}}
-                for p in person_skills['person_carol']
             ]
         }.get((id, kwargs.get('link_type_id')), []))
+        matcher._bulk_get_person_skills = MagicMock(return_value={
+            person_id: {
+                p['skill_id']: {'proficiency': p['proficiency'], 'years': 0}
+                for p in held
+            }
+            for person_id, held in person_skills.items()
+        })
         matcher.get_objects_by_type = MagicMock(return_value=team)
-        matcher._calculate_availability = MagicMock(return_value=50.0)
+        matcher._bulk_availability = MagicMock(side_effect=lambda _, ids: dict.fromkeys(ids, 50.0))
         
         matches = await matcher.find_best_matches('task_ml', limit=3)
         
@@ -686,14 +676,11 @@ class TestNudgeGenerationWorkflow:
             __enter__=MagicMock(return_value=mock_session),
             __exit__=MagicMock()
         ))
-        nudge_gen.get_objects_by_type = MagicMock(side_effect=lambda s, type_id, **kwargs: {
-            'ot_task': at_risk_tasks + safe_tasks,
-            'ot_project': projects
-        }.get(type_id, []))
-        nudge_gen.get_object_by_id = MagicMock(side_effect=lambda s, id: {
+        nudge_gen._get_delay_risk_tasks = MagicMock(return_value=at_risk_tasks + safe_tasks)
+        nudge_gen.get_objects_by_ids = MagicMock(return_value={
             'proj_alpha': projects[0],
             'proj_beta': projects[1]
-        }.get(id))
+        })
         nudge_gen._get_task_assignees = MagicMock(return_value=[
             {'person_id': 'person_alice'}
         ])
@@ -731,23 +718,15 @@ class TestNudgeGenerationWorkflow:
         
         # Step 4: Detect burnout risks
         people = [
-            create_object('person_alice', 'ot_person', {
-                'name': 'Alice',
-                'status': 'active',
-                'manager_id': 'pm_1'
-            }),
-            create_object('person_bob', 'ot_person', {
-                'name': 'Bob',
-                'status': 'active',
-                'manager_id': 'pm_1'
-            })
+            PersonRow('person_alice', 'Alice', 'pm_1'),
+            PersonRow('person_bob', 'Bob', 'pm_1')
         ]
         
-        nudge_gen.get_objects_by_type = MagicMock(return_value=people)
-        nudge_gen._calculate_average_allocation = MagicMock(side_effect=lambda s, p, w: {
+        nudge_gen._get_active_people = MagicMock(return_value=people)
+        nudge_gen._calculate_average_allocations = MagicMock(return_value={
             'person_alice': 95.0,  # Overallocated
             'person_bob': 70.0
-        }.get(p, 0))
+        })
         
         burnout_nudges = await nudge_gen.detect_burnout_risks()
         
@@ -833,7 +812,7 @@ class TestFullSystemWorkflow:
             __enter__=MagicMock(return_value=mock_session),
             __exit__=MagicMock()
         ))
-        nudge_gen.get_objects_by_type = MagicMock(return_value=[])
+        nudge_gen._get_delay_risk_tasks = MagicMock(return_value=[])
         
         delay_nudges = await nudge_gen.detect_delay_risks()
         print(f"   ✓ Nudge generation: {len(delay_nudges)} nudges")
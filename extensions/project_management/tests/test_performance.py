@@ -29,6 +29,7 @@ from extensions.project_management.schedulers import (
     VelocityCalculator,
     ConflictDetector
 )
+from extensions.project_management.schedulers.conflict_detector import AssignmentRow
 
 
 # =============================================================================
@@ -288,9 +289,9 @@ class TestImpactAnalyzerPerformance:
             __exit__=MagicMock()
         ))
         analyzer.get_object_by_id = MagicMock(return_value=project)
-        analyzer.get_linked_objects = MagicMock(return_value=[
-            {'object': task, 'link_data': {}} for task in dependent_tasks
-        ])
+        analyzer._sum_linked_field = MagicMock(return_value=sum(
+            task.data['estimated_hours'] for task in dependent_tasks
+        ))
         
         added_tasks = [
             {'title': f'New Feature {i}', 'estimated_hours': 40}
@@ -407,16 +408,13 @@ class TestConflictDetectorPerformance:
         def mock_get_assignments(session, person_id):
             assignments = []
             for i in range(3):  # 3 assignments per person
-                assignment = create_mock_object(
-                    f'assign_{person_id}_{i}',
-                    'ot_assignment',
-                    {
-                        'person_id': person_id,
-                        'task_id': f'task_{i}',
-                        'allocation_percent': 50,
-                        'planned_start': datetime.utcnow().isoformat(),
-                        'planned_end': (datetime.utcnow() + timedelta(days=5)).isoformat()
-                    }
+                assignment = AssignmentRow(
+                    id=f'assign_{person_id}_{i}',
+                    task_id=f'task_{i}',
+                    planned_hours=None,
+                    allocation_percent=50,
+                    planned_start=datetime.utcnow().isoformat(),
+                    planned_end=(datetime.utcnow() + timedelta(days=5)).isoformat()
                 )
                 assignments.append(assignment)
             return assignments
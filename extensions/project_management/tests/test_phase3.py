@@ -24,7 +24,8 @@ from extensions.project_management.schedulers.velocity_calculator import (
     VelocityMetrics, TaskVelocityRecord
 )
 from extensions.project_management.schedulers.conflict_detector import (
-    Conflict, ConflictType, ConflictSeverity
+    Conflict, ConflictType, ConflictSeverity, AssignmentRow, SprintTaskRow,
+    _sprint_participants_cache
 )
 from extensions.project_management.agent_tools import (
     query_projects,
@@ -282,6 +283,54 @@ class TestConflictDetector:
         assert conflicts[0].conflict_type == ConflictType.OVERALLOCATION
         assert conflicts[0].allocation_percentage == 130.0
     
+    def test_calculate_daily_allocations(self, detector, mock_session):
+        """Test daily allocations sum overlapping assignments per day."""
+        assignments = [
+            AssignmentRow('assign_1', 'task_1', 16, '2026-03-01T00:00:00', '2026-03-03T00:00:00', 80),
+            AssignmentRow('assign_2', 'task_2', 8, '2026-03-03T00:00:00', '2026-03-04T00:00:00', 50),
+            AssignmentRow('assign_3', 'task_3', 8, None, '2026-03-04T00:00:00', 50),
+        ]
+        
+        daily = detector._calculate_daily_allocations(mock_session, assignments)
+        
+        assert daily == {
+            '2026-03-01': 80.0,
+            '2026-03-02': 80.0,
+            '2026-03-03': 130.0,
+            '2026-03-04': 50.0,
+        }
+        
+        in_range = detector._calculate_daily_allocations(
+            mock_session, assignments, {'start': '2026-03-04', 'end': '2026-03-10'}
+        )
+        assert '2026-03-01' not in in_range
+        assert in_range['2026-03-04'] == 50.0
+    
+    @pytest.mark.asyncio
+    async def test_detect_double_bookings(self, detector, mock_session):
+        """Test only overlapping assignments above 100% are reported."""
+        person = create_mock_object('person_1', 'ot_person', {'name': 'Developer'})
+        assignments = [
+            AssignmentRow('assign_1', 'task_1', 16, '2026-03-01T00:00:00', '2026-03-05T00:00:00', 80),
+            AssignmentRow('assign_2', 'task_2', 8, '2026-03-04T00:00:00', '2026-03-06T00:00:00', 50),
+            AssignmentRow('assign_3', 'task_3', 8, '2026-03-10T00:00:00', '2026-03-12T00:00:00', 100),
+        ]
+        
+        detector.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        detector.get_objects_by_type = MagicMock(return_value=[person])
+        detector._get_person_assignments = MagicMock(return_value=assignments)
+        detector.get_object_by_id = MagicMock(return_value=None)
+        
+        conflicts = await detector.detect_double_bookings()
+        
+        assert len(conflicts) == 1
+        assert conflicts[0].conflict_type == ConflictType.DOUBLE_BOOKING
+        assert conflicts[0].allocation_percentage == 130
+        assert conflicts[0].date_range == {
+            'start': '2026-03-04T00:00:00',
+            'end': '2026-03-05T00:00:00'
+        }
+    
     @pytest.mark.asyncio
     async def test_detect_skill_mismatches(self, detector, mock_session):
         """Test skill mismatch detection."""
@@ -346,9 +395,7 @@ class TestConflictDetector:
             'task_id': 'task_1'
         })
         
-        task = create_mock_object('task_1', 'ot_task', {
-            'estimated_hours': 100
-        })
+        task = SprintTaskRow(id='task_1', estimated_hours=100)
         
         detector.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         detector.get_objects_by_type = MagicMock(return_value=[sprint])
@@ -363,6 +410,62 @@ class TestConflictDetector:
         assert conflicts[0].conflict_type == ConflictType.SPRINT_OVERCOMMITMENT
         assert conflicts[0].sprint_id == 'sprint_1'
 
+    
+    @pytest.mark.asyncio
+    async def test_validate_sprint_capacity(self, detector, mock_session):
+        """Test participant loads come from one batched assignment lookup."""
+        sprint = create_mock_object('sprint_1', 'ot_sprint', {'name': 'Sprint 1'})
+        
+        detector.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        detector.get_object_by_id = MagicMock(return_value=sprint)
+        detector._get_sprint_participants = MagicMock(return_value=[
+            {'id': 'person_1', 'name': 'Alice', 'planned_capacity_hours': 40},
+            {'id': 'person_2', 'name': 'Bob', 'planned_capacity_hours': 40},
+        ])
+        detector._get_sprint_tasks = MagicMock(return_value=[
+            SprintTaskRow(id='task_1', estimated_hours=50),
+            SprintTaskRow(id='task_2', estimated_hours=20),
+        ])
+        detector._get_assignments_by_person = MagicMock(return_value={
+            'person_1': [
+                AssignmentRow('assign_1', 'task_1', 50, None, None, 100),
+                AssignmentRow('assign_2', 'task_other', 30, None, None, 100),
+            ],
+            'person_2': [AssignmentRow('assign_3', 'task_2', 20, None, None, 50)],
+        })
+        detector._get_person_assignments = MagicMock()
+        
+        report = await detector.validate_sprint_capacity('sprint_1')
+        
+        detector._get_assignments_by_person.assert_called_once()
+        detector._get_person_assignments.assert_not_called()
+        loads = {p['person_id']: p for p in report['participant_loads']}
+        assert loads['person_1']['allocated_hours'] == 50
+        assert loads['person_1']['status'] == 'overallocated'
+        assert loads['person_2']['allocated_hours'] == 20
+        assert report['overallocation_count'] == 1
+        assert any('Alice' in r for r in report['recommendations'])
+    
+    def test_sprint_participants_cached_per_sprint(self, detector, mock_session):
+        """Test participant lists are cached per sprint and copied out."""
+        person = create_mock_object('person_1', 'ot_person', {'name': 'Alice'})
+        detector.get_linked_objects = MagicMock(return_value=[
+            {'object': person, 'link_data': {'planned_capacity_hours': 60}}
+        ])
+        _sprint_participants_cache.invalidate()
+        
+        first = detector._get_sprint_participants(mock_session, 'sprint_cache')
+        first[0]['name'] = 'Mutated'
+        second = detector._get_sprint_participants(mock_session, 'sprint_cache')
+        
+        assert detector.get_linked_objects.call_count == 1
+        assert second[0]['name'] == 'Alice'
+        assert second[0]['planned_capacity_hours'] == 60
+        
+        _sprint_participants_cache.invalidate('sprint_cache')
+        detector._get_sprint_participants(mock_session, 'sprint_cache')
+        
+        assert detector.get_linked_objects.call_count == 2
 
 # =============================================================================
 # Agent Tools Tests
@@ -374,8 +477,6 @@ class TestAgentTools:
     @pytest.mark.asyncio
     async def test_query_projects(self, mock_db_adapter, mock_session):
         """Test project query tool."""
-        from extensions.project_management.agent_tools.query_tools import query_projects
-        
         base = Mock()
         base.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         
@@ -400,8 +501,6 @@ class TestAgentTools:
     @pytest.mark.asyncio
     async def test_get_project_health(self, mock_db_adapter, mock_session):
         """Test project health tool."""
-        from extensions.project_management.agent_tools.query_tools import get_project_health
-        
         project = create_mock_object('proj_1', 'ot_project', {
             'name': 'Test Project',
             'status': 'active',
@@ -428,8 +527,6 @@ class TestAgentTools:
     @pytest.mark.asyncio
     async def test_create_nudge(self, mock_db_adapter, mock_session):
         """Test create nudge tool."""
-        from extensions.project_management.agent_tools.action_tools import create_nudge
-        
         person = create_mock_object('person_1', 'ot_person', {'name': 'Developer'})
         
         base = Mock()
@@ -10,7 +10,7 @@ Tests cover:
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 import uuid
 
 # Import schedulers
@@ -23,8 +23,12 @@ from extensions.project_management.schedulers import (
 from extensions.project_management.schedulers.priority_calculator import (
     PriorityComponents
 )
+from extensions.project_management.schedulers.impact_analyzer import (
+    ImpactLevel, _person_skills_cache
+)
+from extensions.project_management.schedulers.base import AssignmentRow
 from extensions.project_management.schedulers.nudge_generator import (
-    NudgeCandidate, NudgeType, NudgeSeverity
+    NudgeCandidate, NudgeType, NudgeSeverity, PersonRow
 )
 from extensions.project_management.schedulers.skill_matcher import (
     SkillMatchResult
@@ -109,7 +113,7 @@ class TestPriorityCalculator:
         
         # Setup mocks
         calculator.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
-        calculator.get_object_by_id = MagicMock(side_effect=lambda s, id: {
+        calculator.get_object_by_id = MagicMock(side_effect=lambda _, id: {
             'proj_1': project,
             'cust_1': customer
         }.get(id))
@@ -237,6 +241,73 @@ class TestPriorityCalculator:
         assert 'statistics' in result
         assert result['errors'] == 0
 
+        # All scores are written by one bulk UPDATE, merged into existing data
+        stmt, rows = mock_session.execute.call_args.args
+        assert stmt.is_update
+        assert [row['id'] for row in rows] == ['proj_0', 'proj_1', 'proj_2']
+        assert rows[0]['data']['name'] == 'Project 0'
+        assert rows[0]['data']['priority_score'] == result['scores'][0]['score']
+        assert rows[0]['version'] == 2
+
+    @pytest.mark.asyncio
+    async def test_recalculate_skips_unchanged_priorities(self, calculator, mock_session):
+        """Test that projects whose stored priority is current are not rewritten."""
+        calculator.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+
+        project_data = {
+            'name': 'Steady Project',
+            'customer_id': None,
+            'business_value_score': 60,
+            'strategic_importance': 50
+        }
+        steady = create_mock_object('proj_steady', 'ot_project', project_data)
+        changed = create_mock_object('proj_changed', 'ot_project', dict(project_data))
+
+        calculator.get_objects_by_type = MagicMock(return_value=[steady])
+        calculator._load_dependent_counts = MagicMock(return_value={})
+        first = await calculator.recalculate_all_priorities()
+        _, rows = mock_session.execute.call_args.args
+        steady.data = rows[0]['data']
+        mock_session.execute.reset_mock()
+
+        calculator.get_objects_by_type = MagicMock(return_value=[steady, changed])
+        result = await calculator.recalculate_all_priorities()
+
+        assert first['updated'] == 1
+        assert result['updated'] == 1
+        assert result['unchanged'] == 1
+        assert len(result['scores']) == 2
+        _, rows = mock_session.execute.call_args.args
+        assert [row['id'] for row in rows] == ['proj_changed']
+
+    @pytest.mark.asyncio
+    async def test_recalculate_loads_dependent_counts_once(self, calculator, mock_session):
+        """Test that batch recalculation counts dependents in one grouped load."""
+        calculator.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+
+        projects = [
+            create_mock_object(f'proj_{i}', 'ot_project', {
+                'name': f'Project {i}',
+                'customer_id': None,
+                'business_value_score': 50,
+                'strategic_importance': 50
+            })
+            for i in range(3)
+        ]
+
+        calculator.get_objects_by_type = MagicMock(return_value=projects)
+        calculator._load_dependent_counts = MagicMock(return_value={'proj_0': 2, 'proj_2': 9})
+
+        result = await calculator.recalculate_all_priorities()
+
+        calculator._load_dependent_counts.assert_called_once_with(
+            mock_session, ['proj_0', 'proj_1', 'proj_2']
+        )
+        _, rows = mock_session.execute.call_args.args
+        boosts = [row['data']['priority_components']['dependency_boost_score'] for row in rows]
+        assert boosts == [40.0, 0.0, 100.0]
+        assert result['errors'] == 0
+
 
 # =============================================================================
 # Impact Analyzer Tests
@@ -292,7 +363,7 @@ class TestImpactAnalyzer:
         
         analyzer.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         analyzer.get_object_by_id = MagicMock(return_value=project)
-        analyzer.get_linked_objects = MagicMock(return_value=[])
+        analyzer._sum_linked_field = MagicMock(return_value=0)
         
         added_tasks = [
             {'title': 'New Feature', 'estimated_hours': 40},
@@ -322,8 +393,7 @@ class TestImpactAnalyzer:
         analyzer.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         analyzer.get_object_by_id = MagicMock(return_value=task)
         analyzer.get_linked_objects = MagicMock(return_value=[])
-        analyzer.get_objects_by_type = MagicMock(return_value=[])
-        analyzer._check_person_capacity = MagicMock(return_value=True)
+        analyzer._get_available_people = MagicMock(return_value=[])
         analyzer._calculate_skill_match = MagicMock(return_value={
             'score': 80,
             'matches': [],
@@ -338,6 +408,200 @@ class TestImpactAnalyzer:
         
         assert isinstance(result, list)
 
+    @pytest.mark.asyncio
+    async def test_analyze_leave_impact_affected_tasks(self, analyzer, mock_session):
+        """Test leave impact totals delay, hours and cost across affected tasks."""
+        person = create_mock_object('person_1', 'ot_person', {'name': 'John Doe'})
+        tasks = {
+            'task_1': create_mock_object('task_1', 'ot_task', {'title': 'API', 'project_id': 'proj_1'}),
+            'task_2': create_mock_object('task_2', 'ot_task', {'title': 'UI', 'project_id': 'proj_1'})
+        }
+        project = create_mock_object('proj_1', 'ot_project', {'name': 'Alpha'})
+
+        analyzer.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        analyzer.get_object_by_id = MagicMock(return_value=person)
+        analyzer.get_objects_by_ids = MagicMock(side_effect=lambda _, ids: {
+            i: tasks.get(i) or project for i in ids
+        })
+        analyzer._get_assignments_during_period = MagicMock(return_value=[
+            AssignmentRow('assign_1', 'task_1', 16, '2026-03-01', '2026-03-03', 50),
+            AssignmentRow('assign_2', 'task_2', 60, '2026-03-02', '2026-03-09', 50)
+        ])
+        analyzer._get_available_people = MagicMock(return_value=[])
+
+        result = await analyzer.analyze_leave_impact(
+            person_id='person_1',
+            start_date='2026-03-01',
+            end_date='2026-03-05'
+        )
+
+        assert [t['delay_days'] for t in result.affected_tasks] == [2, 5]
+        assert result.total_delay_days == 7
+        assert result.affected_projects[0]['affected_tasks_count'] == 2
+        assert result.cost_impact['affected_hours'] == 76
+        assert result.impact_level == ImpactLevel.MEDIUM
+
+    @pytest.mark.asyncio
+    async def test_analyze_resource_conflict(self, analyzer, mock_session):
+        """Test only overlapping, over-allocated assignments are reported."""
+        person = create_mock_object('person_1', 'ot_person', {'name': 'John Doe'})
+        assignments = [
+            AssignmentRow('assign_1', 'task_1', 16, '2026-03-01', '2026-03-10', 60),
+            AssignmentRow('assign_2', 'task_2', 16, '2026-03-20', '2026-03-30', 80),
+            AssignmentRow('assign_3', 'task_3', 16, '2026-03-05', '2026-03-25', 50)
+        ]
+
+        analyzer.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        analyzer.get_object_by_id = MagicMock(return_value=person)
+        analyzer._get_person_assignments = MagicMock(return_value=assignments)
+
+        result = await analyzer.analyze_resource_conflict(person_id='person_1')
+
+        pairs = [(c['assignment1'], c['assignment2']) for c in result.resource_conflicts]
+        assert pairs == [('assign_1', 'assign_3'), ('assign_2', 'assign_3')]
+        assert result.resource_conflicts[1]['excess'] == 30
+        assert result.resource_conflicts[0]['date_range'] == {
+            'start': '2026-03-05T00:00:00', 'end': '2026-03-10T00:00:00'
+        }
+        assert result.impact_level == ImpactLevel.MEDIUM
+
+    @pytest.mark.asyncio
+    async def test_find_alternative_resources_shortlists_by_skill(self, analyzer, mock_session):
+        """Test only people holding a required skill are ranked."""
+        task = create_mock_object('task_1', 'ot_task', {'title': 'Development Task'})
+        requirement = {
+            'object': create_mock_object('req_1', 'ot_skill_requirement', {'skill_id': 'python'}),
+            'link_data': {}
+        }
+        qualified = create_mock_object('person_2', 'ot_person', {'name': 'Jane'})
+
+        analyzer.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        analyzer.get_object_by_id = MagicMock(return_value=task)
+        analyzer.get_linked_objects = MagicMock(return_value=[requirement])
+        analyzer._get_qualified_people = MagicMock(return_value=[qualified])
+        analyzer._get_available_people = MagicMock()
+        analyzer._bulk_load_person_skills = MagicMock(return_value={'person_2': {'python': 2}})
+
+        result = await analyzer.find_alternative_resources('task_1', exclude_person_id='person_1')
+
+        assert [r['person_id'] for r in result] == ['person_2']
+        analyzer._get_qualified_people.assert_called_once_with(
+            mock_session, ['python'], exclude_person_id='person_1'
+        )
+        analyzer._get_available_people.assert_not_called()
+        analyzer.get_linked_objects.assert_called_once()
+
+    def test_rank_alternatives_with_preloaded_skills(self, analyzer, mock_session):
+        """Test ranking uses preloaded skills instead of per-person queries."""
+        task = create_mock_object('task_1', 'ot_task', {'title': 'Development Task'})
+        requirement = {
+            'object': create_mock_object('req_1', 'ot_skill_requirement', {
+                'skill_id': 'python', 'minimum_proficiency': 3
+            }),
+            'link_data': {}
+        }
+        candidates = [
+            create_mock_object('person_2', 'ot_person', {'name': 'Jane'}),
+            create_mock_object('person_3', 'ot_person', {'name': 'Bob'})
+        ]
+
+        analyzer.get_object_by_id = MagicMock(return_value=task)
+        analyzer.get_linked_objects = MagicMock(return_value=[requirement])
+
+        result = analyzer._rank_alternatives(
+            mock_session, 'task_1', candidates,
+            person_skills={'person_3': {'python': 4}}
+        )
+
+        assert [r['person_id'] for r in result] == ['person_3', 'person_2']
+        assert result[0]['skill_match_score'] == 100
+        analyzer.get_linked_objects.assert_called_once()
+
+    def test_calculate_skill_match_batch(self, analyzer, mock_session):
+        """Test batch scores agree with scoring each person separately."""
+        requirements = [
+            {
+                'object': create_mock_object('req_1', 'ot_skill_requirement', {
+                    'skill_id': 'python', 'minimum_proficiency': 4
+                }),
+                'link_data': {}
+            },
+            {
+                'object': create_mock_object('req_2', 'ot_skill_requirement', {
+                    'skill_id': 'sql'
+                }),
+                'link_data': {}
+            }
+        ]
+        person_skills = {
+            'person_1': {'python': 4, 'sql': 2},
+            'person_2': {'python': 2, 'go': 5}
+        }
+
+        scores = analyzer._calculate_skill_match_batch(
+            mock_session, ['person_1', 'person_2', 'person_3'], requirements,
+            person_skills=person_skills
+        )
+
+        assert list(scores) == [100.0, 12.5, 0.0]
+        for person_id, score in zip(['person_1', 'person_2'], scores[:2], strict=True):
+            match = analyzer._calculate_skill_match(
+                mock_session, person_id, requirements,
+                person_skill_map=person_skills[person_id]
+            )
+            assert match['score'] == round(score, 2)
+
+    def test_person_skills_cached_per_person(self, analyzer, mock_session):
+        """Test person skill maps are cached per person and copied out."""
+        _person_skills_cache.invalidate()
+        mock_session.execute = MagicMock(return_value=[
+            ('person_cache', {'proficiency_level': 3}, 'python')
+        ])
+
+        first = analyzer._bulk_load_person_skills(mock_session, ['person_cache'])
+        first['person_cache']['python'] = 5
+        second = analyzer._bulk_load_person_skills(mock_session, ['person_cache'])
+
+        assert mock_session.execute.call_count == 1
+        assert second == {'person_cache': {'python': 3}}
+
+        _person_skills_cache.invalidate('person_cache')
+        analyzer._bulk_load_person_skills(mock_session, ['person_cache'])
+
+        assert mock_session.execute.call_count == 2
+        _person_skills_cache.invalidate()
+
+    def test_get_assignments_during_period(self, analyzer, mock_session):
+        """Test only assignments overlapping the leave are returned."""
+        assignments = [
+            AssignmentRow('assign_1', 'task_1', 16, '2026-02-20', '2026-03-01T09:00:00Z', 50),
+            AssignmentRow('assign_2', 'task_2', 16, '2026-03-06', '2026-03-10', 50),
+            AssignmentRow('assign_3', 'task_3', 16, '2026-03-02', None, 50)
+        ]
+        analyzer._get_person_assignments = MagicMock(return_value=assignments)
+
+        result = analyzer._get_assignments_during_period(
+            mock_session, 'person_1', datetime(2026, 3, 1), datetime(2026, 3, 5)
+        )
+
+        assert [a.id for a in result] == ['assign_1']
+        assert list(analyzer._calculate_task_delays(
+            [AssignmentRow('assign_4', 'task_4', 60, None, None, 50)], 5
+        )) == [5]
+
+    def test_bulk_critical_path(self, analyzer, mock_neo4j_adapter):
+        """Test critical path lookups are batched and memoized."""
+        mock_neo4j_adapter.execute_read = MagicMock(return_value=[
+            {'tid': 'task_1', 'dependent_count': 3},
+            {'tid': 'task_2', 'dependent_count': 1}
+        ])
+
+        result = analyzer._bulk_critical_path(['task_1', 'task_2'])
+
+        assert result == {'task_1': True, 'task_2': False}
+        assert analyzer._is_on_critical_path('task_1') is True
+        mock_neo4j_adapter.execute_read.assert_called_once()
+
 
 # =============================================================================
 # Nudge Generator Tests
@@ -376,8 +640,8 @@ class TestNudgeGenerator:
         })
         
         generator.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
-        generator.get_objects_by_type = MagicMock(return_value=[at_risk_task, safe_task])
-        generator.get_object_by_id = MagicMock(return_value=project)
+        generator._get_delay_risk_tasks = MagicMock(return_value=[at_risk_task, safe_task])
+        generator.get_objects_by_ids = MagicMock(return_value={'proj_1': project})
         generator._get_task_assignees = MagicMock(return_value=[])
         
         # Execute
@@ -463,30 +727,62 @@ class TestNudgeGenerator:
     @pytest.mark.asyncio
     async def test_detect_burnout_risks(self, generator, mock_session):
         """Test burnout risk detection."""
-        overallocated_person = create_mock_object('person_1', 'ot_person', {
-            'name': 'Overworked Employee',
-            'status': 'active',
-            'manager_id': 'mgr_1'
-        })
-        
-        normal_person = create_mock_object('person_2', 'ot_person', {
-            'name': 'Normal Employee',
-            'status': 'active',
-            'manager_id': 'mgr_1'
-        })
+        overallocated_person = PersonRow('person_1', 'Overworked Employee', 'mgr_1')
+        normal_person = PersonRow('person_2', 'Normal Employee', 'mgr_1')
         
         generator.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
-        generator.get_objects_by_type = MagicMock(return_value=[overallocated_person, normal_person])
-        generator._calculate_average_allocation = MagicMock(side_effect=lambda s, p, w: {
+        generator._get_active_people = MagicMock(return_value=[overallocated_person, normal_person])
+        generator._calculate_average_allocations = MagicMock(return_value={
             'person_1': 95.0,
             'person_2': 70.0
-        }.get(p, 0))
+        })
         
         candidates = await generator.detect_burnout_risks()
         
         assert len(candidates) == 1
         assert candidates[0].related_person_id == 'person_1'
         assert 'Overworked Employee' in candidates[0].title
+    
+    @pytest.mark.asyncio
+    async def test_burnout_nudges_created_for_each_report(self, generator, mock_session):
+        """Test overallocated reports of one manager each get a burnout nudge."""
+        generator.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        for detector in ('detect_delay_risks', 'detect_resource_conflicts', 'detect_skill_gaps',
+                         'detect_opportunities', 'detect_dependency_bottlenecks'):
+            setattr(generator, detector, AsyncMock(return_value=[]))
+        generator._get_active_people = MagicMock(return_value=[
+            PersonRow('person_1', 'First Report', 'mgr_1'),
+            PersonRow('person_2', 'Second Report', 'mgr_1')
+        ])
+        generator._calculate_average_allocations = MagicMock(return_value={
+            'person_1': 110.0,
+            'person_2': 105.0
+        })
+        mock_session.execute = MagicMock(return_value=[])
+        
+        result = await generator.generate_nudges()
+        
+        assert result['created'] == 2
+        assert result['skipped_duplicates'] == 0
+        rows = mock_session.execute.call_args.args[1]
+        assert {
+            row['data']['related_person_id'] for row in rows if row['type_id'] == 'ot_nudge'
+        } == {'person_1', 'person_2'}
+        
+        # A recent nudge about one report only suppresses that report's nudge
+        mock_session.execute = MagicMock(side_effect=[
+            [('mgr_1', None, 'person_1', 'risk')],
+            None
+        ])
+        
+        result = await generator.generate_nudges()
+        
+        assert result['created'] == 1
+        assert result['skipped_duplicates'] == 1
+        rows = mock_session.execute.call_args.args[1]
+        assert [
+            row['data']['related_person_id'] for row in rows if row['type_id'] == 'ot_nudge'
+        ] == ['person_2']
 
 
 # =============================================================================
@@ -542,11 +838,17 @@ class TestSkillMatcher:
             'skill_react': skill
         }.get(id))
         matcher.get_linked_objects = MagicMock(side_effect=lambda s, id, **kwargs: {
-            ('task_1', 'lt_task_requires_skill'): [{'object': skill_req, 'link_data': {}}],
-            ('person_1', 'lt_person_has_skill'): [{'object': person_skill, 'link_data': {'proficiency_level': 4}}]
+            ('task_1', 'lt_task_requires_skill'): [{'object': skill_req, 'link_data': {}}]
         }.get((id, kwargs.get('link_type_id'))))
+        matcher._bulk_get_person_skills = MagicMock(return_value={
+            person_skill.data['person_id']: {
+                person_skill.data['skill_id']: {
+                    'proficiency': person_skill.data['proficiency_level'], 'years': 0
+                }
+            }
+        })
         matcher.get_objects_by_type = MagicMock(return_value=[person])
-        matcher._calculate_availability = MagicMock(return_value=50.0)
+        matcher._bulk_availability = MagicMock(side_effect=lambda _, ids: dict.fromkeys(ids, 50.0))
         
         # Execute
         matches = await matcher.find_best_matches('task_1', limit=5)
@@ -557,6 +859,35 @@ class TestSkillMatcher:
         assert matches[0].is_full_match is True
         assert len(matches[0].matching_skills) == 1
     
+    @pytest.mark.asyncio
+    async def test_find_best_matches_builds_only_returned_results(self, matcher, mock_session):
+        """Test detailed results are built only for the top matches returned."""
+        people = [
+            create_mock_object(f'person_{level}', 'ot_person', {'name': f'Level {level}'})
+            for level in range(1, 5)
+        ]
+        
+        matcher.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        matcher.get_object_by_id = MagicMock(return_value=create_mock_object('task_1', 'ot_task', {}))
+        matcher._get_task_skill_requirements = MagicMock(return_value=[
+            {'skill_id': 'skill_react', 'skill_name': 'React', 'skill_category': 'technical',
+             'min_proficiency': 4, 'preferred_proficiency': None, 'is_mandatory': True, 'weight': 2.0}
+        ])
+        matcher.get_objects_by_type = MagicMock(return_value=people)
+        matcher._bulk_get_person_skills = MagicMock(return_value={
+            f'person_{level}': {'skill_react': {'proficiency': level, 'years': 0}}
+            for level in range(1, 5)
+        })
+        matcher._bulk_availability = MagicMock(side_effect=lambda _, ids: dict.fromkeys(ids, 50.0))
+        matcher._calculate_match = MagicMock(wraps=matcher._calculate_match)
+        
+        matches = await matcher.find_best_matches('task_1', limit=2, min_score=20)
+        
+        assert [m.person_id for m in matches] == ['person_4', 'person_3']
+        assert [m.match_score for m in matches] == [100.0, 37.5]
+        assert matcher._calculate_match.call_count == 2
+        matcher._bulk_availability.assert_called_once_with(mock_session, ['person_4', 'person_3'])
+    
     @pytest.mark.asyncio
     async def test_calculate_skill_match_partial(self, matcher, mock_session):
         """Test skill match calculation for partial match."""
@@ -585,14 +916,10 @@ class TestSkillMatcher:
             'status': 'active'
         })
         
-        person_skills = [
-            {'object': create_mock_object('ps_1', 'ot_person_skill', {
-                'skill_id': 'skill_react'
-            }), 'link_data': {'proficiency_level': 4}},
-            {'object': create_mock_object('ps_2', 'ot_person_skill', {
-                'skill_id': 'skill_python'
-            }), 'link_data': {'proficiency_level': 2}}
-        ]
+        person_skills = {
+            'skill_react': {'proficiency': 4, 'years': 0},
+            'skill_python': {'proficiency': 2, 'years': 0}
+        }
         
         matcher.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         matcher.get_object_by_id = MagicMock(side_effect=lambda s, id: {
@@ -605,9 +932,9 @@ class TestSkillMatcher:
             ('task_1', 'lt_task_requires_skill'): [
                 {'object': skill_reqs[0], 'link_data': {}},
                 {'object': skill_reqs[1], 'link_data': {}}
-            ],
-            ('person_1', 'lt_person_has_skill'): person_skills
+            ]
         }.get((id, kwargs.get('link_type_id'))))
+        matcher._bulk_get_person_skills = MagicMock(return_value={'person_1': person_skills})
         matcher._calculate_availability = MagicMock(return_value=50.0)
         matcher._get_task_skill_requirements = MagicMock(return_value=[
             {'skill_id': 'skill_react', 'skill_name': 'React', 'skill_category': 'technical',
@@ -627,6 +954,59 @@ class TestSkillMatcher:
         assert len(result.below_required) == 1  # Python below required
         assert result.is_full_match is False
     
+    def test_score_matches_all_people(self, matcher):
+        """Test match scores are computed for every person in one pass."""
+        requirements = [
+            {'skill_id': 'skill_react', 'min_proficiency': 3, 'weight': 2.0},
+            {'skill_id': 'skill_python', 'min_proficiency': 4, 'weight': 1.0}
+        ]
+        person_skills = {
+            'person_full': {
+                'skill_react': {'proficiency': 3, 'years': 2},
+                'skill_python': {'proficiency': 4, 'years': 1}
+            },
+            'person_partial': {
+                'skill_react': {'proficiency': 4, 'years': 5},
+                'skill_python': {'proficiency': 2, 'years': 0},
+                'skill_go': {'proficiency': 4, 'years': 3}
+            }
+        }
+        
+        scores = matcher._score_matches(
+            ['person_full', 'person_partial', 'person_none'], person_skills, requirements
+        )
+        
+        # Partial: React full (1.0 x 2), Python 2/4 x 0.5 = 0.25 (x 1) -> 2.25 / 3
+        assert scores.tolist() == [100.0, (2.25 / 3) * 100, 0.0]
+    
+    def test_score_matches_repeated_skill_requirement(self, matcher):
+        """Test a skill required twice is scored against both requirements."""
+        requirements = [
+            {'skill_id': 'skill_react', 'min_proficiency': 2, 'weight': 1.0},
+            {'skill_id': 'skill_react', 'min_proficiency': 4, 'weight': 1.0}
+        ]
+        person_skills = {'person_1': {'skill_react': {'proficiency': 2, 'years': 1}}}
+        
+        scores = matcher._score_matches(['person_1'], person_skills, requirements)
+        
+        # 1.0 for the first requirement, 2/4 x 0.5 = 0.25 for the second
+        assert scores.tolist() == [62.5]
+    
+    def test_count_qualified_people_single_query(self, matcher, mock_session):
+        """Test qualified people are counted in SQL without per-person lookups."""
+        mock_session.scalar = MagicMock(return_value=3)
+        matcher.get_object_by_id = MagicMock()
+        
+        count = matcher._count_qualified_people(mock_session, 'skill_rust', 3)
+        
+        assert count == 3
+        mock_session.scalar.assert_called_once()
+        assert mock_session.scalar.call_args.args[1] == {
+            'skill_id': 'skill_rust',
+            'min_proficiency': 3
+        }
+        matcher.get_object_by_id.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_identify_skill_gaps(self, matcher, mock_session):
         """Test organization-wide skill gap identification."""
@@ -652,21 +1032,20 @@ class TestSkillMatcher:
             'category': 'technical'
         })
         
-        person = create_mock_object('person_1', 'ot_person', {
-            'name': 'Rust Expert',
-            'status': 'active'
-        })
-        
         matcher.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         matcher._get_all_skill_requirements = MagicMock(return_value=[
-            {'skill_id': 'skill_rust', 'task_id': f'task_{i}', 'min_proficiency': 3, 'is_mandatory': True}
-            for i in range(10)
+            {
+                'skill_id': req.data['skill_id'],
+                'task_id': req.data['task_id'],
+                'min_proficiency': req.data['minimum_proficiency'],
+                'is_mandatory': True
+            }
+            for req in skill_reqs
         ])
-        matcher.get_object_by_id = MagicMock(side_effect=lambda s, id: {
-            'skill_rust': skill,
-            'person_1': person
-        }.get(id))
-        matcher._count_qualified_people = MagicMock(return_value=1)
+        matcher.get_objects_by_ids = MagicMock(return_value={'skill_rust': skill})
+        matcher._count_qualified_people_by_skill = MagicMock(return_value={
+            person_skill.data['skill_id']: 1
+        })
         
         gaps = await matcher.identify_skill_gaps()
         
@@ -675,7 +1054,68 @@ class TestSkillMatcher:
         assert gaps[0].tasks_requiring == 10
         assert gaps[0].qualified_people == 1
         assert gaps[0].gap_severity in ['critical', 'high']
-
+        matcher._count_qualified_people_by_skill.assert_called_once_with(
+            mock_session, {'skill_rust': 3}
+        )
+    
+    def test_bulk_availability(self, matcher, mock_session):
+        """Test availability for several people comes from one aggregate query."""
+        mock_session.execute = MagicMock(return_value=[
+            ('person_1', 30.0),
+            ('person_2', 120.0)
+        ])
+        
+        availability = matcher._bulk_availability(
+            mock_session, ['person_1', 'person_2', 'person_3']
+        )
+        
+        assert availability == {'person_1': 70.0, 'person_2': 0.0, 'person_3': 100.0}
+        mock_session.execute.assert_called_once()
+    
+    def test_count_qualified_people_by_skill(self, matcher, mock_session):
+        """Test qualified counts for all skills come from one grouped query."""
+        mock_session.execute = MagicMock(return_value=[
+            ('skill_rust', 4.0, 1),
+            ('skill_rust', 2.0, 3),
+            ('skill_go', 3.0, 2),
+            ('skill_go', 5.0, 1)
+        ])
+        
+        counts = matcher._count_qualified_people_by_skill(mock_session, {
+            'skill_rust': 3, 'skill_go': 3, 'skill_zig': 1
+        })
+        
+        assert counts == {'skill_rust': 1, 'skill_go': 3, 'skill_zig': 0}
+        mock_session.execute.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_skill_gaps_cached_per_matcher(self, matcher, mock_session):
+        """Test repeat gap reports on one matcher reuse its analysis until the TTL."""
+        matcher.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
+        matcher._get_all_skill_requirements = MagicMock(return_value=[
+            {'skill_id': 'skill_go', 'task_id': 'task_1', 'min_proficiency': 2, 'is_mandatory': True}
+        ])
+        matcher.get_objects_by_ids = MagicMock(return_value={
+            'skill_go': create_mock_object('skill_go', 'ot_skill', {'name': 'Go', 'category': 'technical'})
+        })
+        matcher._count_qualified_people_by_skill = MagicMock(return_value={'skill_go': 0})
+        
+        first = await matcher.identify_skill_gaps()
+        first[0].affected_task_ids.append('task_mutated')
+        first.clear()
+        second = await matcher.identify_skill_gaps()
+        
+        assert len(second) == 1
+        assert second[0].affected_task_ids == ['task_1']
+        assert matcher._get_all_skill_requirements.call_count == 1
+        assert SkillMatcher()._gap_cache is None
+        
+        # Once the TTL has passed the analysis is redone
+        cached_at, gaps = matcher._gap_cache
+        matcher._gap_cache = (cached_at - matcher.SKILL_GAPS_TTL, gaps)
+        await matcher.identify_skill_gaps()
+        
+        assert matcher._get_all_skill_requirements.call_count == 2
 
 # =============================================================================
 # Integration Tests
@@ -715,7 +1155,7 @@ class TestSchedulerIntegration:
         calculator.get_objects_by_type = MagicMock(return_value=[project])
         analyzer.get_session = MagicMock(return_value=MagicMock(__enter__=MagicMock(return_value=mock_session), __exit__=MagicMock()))
         analyzer.get_object_by_id = MagicMock(return_value=project)
-        analyzer.get_linked_objects = MagicMock(return_value=[])
+        analyzer._sum_linked_field = MagicMock(return_value=0)
         
         # Calculate priority
         priority_result = await calculator.calculate_project_priority('proj_1', save=False)
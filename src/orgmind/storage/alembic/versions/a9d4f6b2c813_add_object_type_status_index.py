@@ -0,0 +1,28 @@
+"""Add object type/status index
+
+Revision ID: a9d4f6b2c813
+Revises: f3c8e1d5a692
+Create Date: 2026-10-17 16:48:37.204611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4f6b2c813'
+down_revision: Union[str, Sequence[str], None] = 'f3c8e1d5a692'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Scheduler scans select one object type in one status ("active people")
+    op.create_index('idx_objects_type_status', 'objects', ['type_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_objects_type_status', table_name='objects')
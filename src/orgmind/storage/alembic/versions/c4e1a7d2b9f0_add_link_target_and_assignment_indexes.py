@@ -0,0 +1,38 @@
+"""Add link target and assignment date indexes
+
+Revision ID: c4e1a7d2b9f0
+Revises: 2b863a3c9f73
+Create Date: 2026-10-17 10:12:31.418210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a7d2b9f0'
+down_revision: Union[str, Sequence[str], None] = '2b863a3c9f73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Reverse link lookups ("assignments linked to this person")
+    op.create_index('idx_links_type_target', 'links', ['type_id', 'target_id'], unique=False)
+    # Assignment period filters compare the ISO planned_start text
+    op.create_index(
+        'idx_objects_assignment_planned_start',
+        'objects',
+        [sa.text("(data ->> 'planned_start')")],
+        unique=False,
+        postgresql_where=sa.text("type_id = 'ot_assignment'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_objects_assignment_planned_start', table_name='objects')
+    op.drop_index('idx_links_type_target', table_name='links')
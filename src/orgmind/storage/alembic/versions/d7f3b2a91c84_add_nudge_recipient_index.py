@@ -0,0 +1,35 @@
+"""Add nudge recipient index
+
+Revision ID: d7f3b2a91c84
+Revises: c4e1a7d2b9f0
+Create Date: 2026-10-17 14:36:08.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f3b2a91c84'
+down_revision: Union[str, Sequence[str], None] = 'c4e1a7d2b9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nudge dedup looks up recent nudges by recipient
+    op.create_index(
+        'idx_objects_nudge_recipient_created',
+        'objects',
+        [sa.text("(data ->> 'recipient_id')"), 'created_at'],
+        unique=False,
+        postgresql_where=sa.text("type_id = 'ot_nudge'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_objects_nudge_recipient_created', table_name='objects')
@@ -0,0 +1,35 @@
+"""Add task status index
+
+Revision ID: e2a6c8d41f57
+Revises: d7f3b2a91c84
+Create Date: 2026-10-17 15:02:44.173905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a6c8d41f57'
+down_revision: Union[str, Sequence[str], None] = 'd7f3b2a91c84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Scheduler scans filter tasks on their workflow status
+    op.create_index(
+        'idx_objects_task_status',
+        'objects',
+        [sa.text("(data ->> 'status')")],
+        unique=False,
+        postgresql_where=sa.text("type_id = 'ot_task'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_objects_task_status', table_name='objects')
@@ -0,0 +1,35 @@
+"""Add task priority index
+
+Revision ID: f3c8e1d5a692
+Revises: e2a6c8d41f57
+Create Date: 2026-10-17 16:21:09.518347
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8e1d5a692'
+down_revision: Union[str, Sequence[str], None] = 'e2a6c8d41f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nudge opportunities look for tasks above a numeric priority score
+    op.create_index(
+        'idx_objects_task_priority_score',
+        'objects',
+        [sa.text("(CAST(data ->> 'priority_score' AS FLOAT))")],
+        unique=False,
+        postgresql_where=sa.text("type_id = 'ot_task'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_objects_task_priority_score', table_name='objects')
@@ -47,6 +47,10 @@ class ObjectModel(Base):
     # Relationships
     object_type: Mapped["ObjectTypeModel"] = relationship()
 
+    __table_args__ = (
+        Index('idx_objects_type_status', 'type_id', 'status'),
+    )
+
 # --- Link Types ---
 
 class LinkTypeModel(Base):
@@ -76,6 +80,7 @@ class LinkModel(Base):
     
     __table_args__ = (
         UniqueConstraint('type_id', 'source_id', 'target_id', name='uq_link_source_target_type'),
+        Index('idx_links_type_target', 'type_id', 'target_id'),
     )
 
 # --- Sources ---
@@ -19,6 +19,7 @@ class PostgresConfig(BaseSettings):
     POSTGRES_DB: str = "orgmind"
     POSTGRES_POOL_SIZE: int = 5
     POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_QUERY_CACHE_SIZE: int = 1200
     
     model_config = {"env_file": ".env", "extra": "ignore"}
     
@@ -47,6 +48,7 @@ class PostgresAdapter(StorageAdapter):
                 self.config.connection_string,
                 pool_size=self.config.POSTGRES_POOL_SIZE,
                 max_overflow=self.config.POSTGRES_MAX_OVERFLOW,
+                query_cache_size=self.config.POSTGRES_QUERY_CACHE_SIZE,
                 pool_pre_ping=True
             )
             